@@ -1,6 +1,7 @@
 """Configuration settings for the Natural Language → TOPdesk MCP Router."""
 
 import os
+from types import SimpleNamespace
 from pydantic import Field
 from pydantic_settings import BaseSettings
 from typing import Optional
@@ -23,6 +24,7 @@ class Settings(BaseSettings):
     
     # Logging configuration
     log_level: str = Field("INFO", env="LOG_LEVEL", description="Logging level")
+    debug_tracebacks: bool = Field(False, env="DEBUG_TRACEBACKS", description="Include tracebacks when logging unhandled exceptions")
     
     # Rate limiting configuration
     rate_limit_requests: int = Field(60, description="Maximum requests per time window")
@@ -35,6 +37,7 @@ class Settings(BaseSettings):
     # Request timeouts and retries
     mcp_timeout: int = Field(8, description="Timeout for MCP requests in seconds")
     mcp_retries: int = Field(2, description="Number of retries for MCP requests")
+    mcp_max_backoff: float = Field(5.0, description="Maximum wait between MCP retries in seconds")
     
     # Default query limits
     default_max_results: int = Field(5, description="Default maximum results per query")
@@ -43,6 +46,9 @@ class Settings(BaseSettings):
     # Default time filters (days)
     default_time_window: int = Field(30, description="Default time window in days for queries")
     
+    # Startup warm-up
+    planner_warmup_file: Optional[str] = Field(None, description="File with one query per line used to warm the planner at startup")
+    
     class Config:
         env_file = ".env"
         case_sensitive = False
@@ -70,4 +76,8 @@ except Exception as e:
         # Default to MCP server mode
         settings = Settings(
             mcp_base_url=os.getenv("MCP_BASE_URL", "http://localhost:3030")
-        )
\ No newline at end of file
+        )
+
+
+# Plain-attribute snapshot of the settings for per-request hot paths
+settings_snapshot = SimpleNamespace(**settings.model_dump())
@@ -1,11 +1,22 @@
 """FIQL query building utilities for TOPdesk API."""
 
 import re
-from datetime import datetime, timedelta
-from typing import List, Optional, Union
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Sequence, Union
 from urllib.parse import quote
 
 
+# Patterns stripped from FIQL queries by sanitize_fiql, compiled once at import
+_SCRIPT_RE = re.compile(r'<script.*?</script>', re.IGNORECASE | re.DOTALL)
+_SQL_RE = re.compile(r'\b(?:DROP|DELETE|INSERT|UPDATE|UNION|SELECT|EXEC)\b', re.IGNORECASE)
+
+# Valid FIQL comparison operators, matched in one pass by validate_fiql
+_FIQL_OPERATORS = ('==', '!=', '=ge=', '=le=', '=gt=', '=lt=', '=sw=', '=in=')
+_OP_RE = re.compile('|'.join(map(re.escape, _FIQL_OPERATORS)))
+
+
+@lru_cache(maxsize=1024)
 def quote_value(value: str) -> str:
     """Quote and escape a FIQL value properly.
     
@@ -18,7 +29,9 @@ def quote_value(value: str) -> str:
     if not value:
         return "''"
     
-    # Escape backslashes first
+    # Escape backslashes first. Chained str.replace is kept on purpose: it
+    # returns the input unchanged when there is nothing to escape, which
+    # beats both str.translate and a regex substitution for typical values.
     escaped = value.replace('\\', '\\\\')
     
     # Escape single quotes
@@ -39,22 +52,27 @@ def iso_utc(dt: datetime) -> str:
     """
     if dt.tzinfo is None:
         # Assume UTC if no timezone info
-        dt = dt.replace(tzinfo=datetime.now().astimezone().tzinfo)
+        dt = dt.replace(tzinfo=timezone.utc)
+    else:
+        dt = dt.astimezone(timezone.utc)
     
-    return dt.strftime('%Y-%m-%dT%H:%M:%SZ')
+    # isoformat is cheaper than strftime; keep YYYY-MM-DDTHH:MM:SS and drop the offset
+    return dt.isoformat(timespec='seconds')[:19] + 'Z'
 
 
-def days_ago(days: int) -> str:
+def days_ago(days: int, now: Optional[datetime] = None) -> str:
     """Get ISO timestamp for N days ago.
     
     Args:
         days: Number of days to subtract from now
+        now: Reference time, so callers can share one clock reading
         
     Returns:
         ISO 8601 formatted timestamp
     """
-    dt = datetime.utcnow() - timedelta(days=days)
-    return iso_utc(dt)
+    if now is None:
+        now = datetime.now(timezone.utc)
+    return iso_utc(now - timedelta(days=days))
 
 
 def and_join(*parts: str) -> str:
@@ -67,8 +85,7 @@ def and_join(*parts: str) -> str:
         Joined FIQL query string
     """
     # Filter out empty/None parts
-    valid_parts = [part for part in parts if part and part.strip()]
-    return ';'.join(valid_parts)
+    return ';'.join([part for part in parts if part and part.strip()])
 
 
 def or_join(*parts: str) -> str:
@@ -81,16 +98,15 @@ def or_join(*parts: str) -> str:
         Joined FIQL query string
     """
     # Filter out empty/None parts
-    valid_parts = [part for part in parts if part and part.strip()]
-    return ','.join(valid_parts)
+    return ','.join([part for part in parts if part and part.strip()])
 
 
-def in_list(field: str, values: List[str]) -> str:
+def in_list(field: str, values: Sequence[str]) -> str:
     """Create FIQL 'in' query for a field with multiple values.
     
     Args:
         field: Field name
-        values: List of values to match
+        values: Values to match
         
     Returns:
         FIQL 'in' query string
@@ -99,7 +115,7 @@ def in_list(field: str, values: List[str]) -> str:
         return ""
     
     # Quote each value
-    quoted_values = [quote_value(str(v)) for v in values]
+    quoted_values = [quote_value(v if type(v) is str else str(v)) for v in values]
     values_str = ','.join(quoted_values)
     return f"{field}=in=({values_str})"
 
@@ -114,7 +130,7 @@ def equals(field: str, value: str) -> str:
     Returns:
         FIQL equals query string
     """
-    return f"{field}=={quote_value(str(value))}"
+    return f"{field}=={quote_value(value if type(value) is str else str(value))}"
 
 
 def not_equals(field: str, value: str) -> str:
@@ -127,7 +143,7 @@ def not_equals(field: str, value: str) -> str:
     Returns:
         FIQL not equals query string
     """
-    return f"{field}!={quote_value(str(value))}"
+    return f"{field}!={quote_value(value if type(value) is str else str(value))}"
 
 
 def starts_with(field: str, value: str) -> str:
@@ -140,7 +156,7 @@ def starts_with(field: str, value: str) -> str:
     Returns:
         FIQL starts with query string
     """
-    return f"{field}=sw={quote_value(str(value))}"
+    return f"{field}=sw={quote_value(value if type(value) is str else str(value))}"
 
 
 def greater_equal(field: str, value: Union[str, datetime]) -> str:
@@ -199,6 +215,23 @@ def build_person_query(first_name: Optional[str] = None, last_name: Optional[str
     return and_join(*parts)
 
 
+def build_person_query_from_parts(name_parts: Sequence[str]) -> str:
+    """Build FIQL query for person lookup from an already split name.
+    
+    Args:
+        name_parts: Words of the person's name
+        
+    Returns:
+        FIQL query on first name and surname, or on surname alone for a
+        single-word name
+    """
+    if len(name_parts) >= 2:
+        return build_person_query(first_name=name_parts[0], last_name=name_parts[-1])
+    
+    # Try surname lookup first
+    return build_person_query(last_name=name_parts[0] if name_parts else None)
+
+
 def build_operator_query(name: Optional[str] = None, exact: bool = True) -> str:
     """Build FIQL query for operator lookup.
     
@@ -245,46 +278,29 @@ def build_incident_query(caller_id: Optional[str] = None,
     Returns:
         FIQL query string for incident search
     """
-    parts = []
-    
-    # Caller filter
-    if caller_id:
-        parts.append(equals("caller.id", caller_id))
-    
-    # Operator filter
-    if operator_id:
-        parts.append(equals("operator.id", operator_id))
-    elif operator_name:
-        parts.append(equals("operator.name", operator_name))
-    
-    # Status exclusions
-    if status_exclude:
-        for status in status_exclude:
-            parts.append(not_equals("status", status))
-    
-    # Priority filter
-    if priority_levels:
-        parts.append(in_list("priority.name", priority_levels))
-    
-    # Category filter
-    if category:
-        parts.append(equals("category.name", category))
-    
-    # Title filter
-    if title_starts:
-        parts.append(starts_with("briefDescription", title_starts))
-    
-    # Date filters
+    # Relative window overrides created_after
     if days_back is not None:
-        created_after = datetime.utcnow() - timedelta(days=days_back)
-    
-    if created_after:
-        parts.append(greater_equal("creationDate", created_after))
-    
-    if created_before:
-        parts.append(less_than("creationDate", created_before))
-    
-    return and_join(*parts)
+        created_after = datetime.now(timezone.utc) - timedelta(days=days_back)
+    
+    # Unset filters yield '' and are dropped before joining with AND
+    return ';'.join(filter(None, (
+        # Caller filter
+        equals("caller.id", caller_id) if caller_id else '',
+        # Operator filter
+        equals("operator.id", operator_id) if operator_id else
+        equals("operator.name", operator_name) if operator_name else '',
+        # Status exclusions
+        ';'.join([not_equals("status", status) for status in status_exclude]) if status_exclude else '',
+        # Priority filter
+        in_list("priority.name", priority_levels) if priority_levels else '',
+        # Category filter
+        equals("category.name", category) if category else '',
+        # Title filter
+        starts_with("briefDescription", title_starts) if title_starts else '',
+        # Date filters
+        greater_equal("creationDate", created_after) if created_after else '',
+        less_than("creationDate", created_before) if created_before else '',
+    )))
 
 
 def validate_fiql(query: str) -> bool:
@@ -311,10 +327,7 @@ def validate_fiql(query: str) -> bool:
         return False
     
     # Basic operator validation - should contain at least one valid operator
-    operators = ['==', '!=', '=ge=', '=le=', '=gt=', '=lt=', '=sw=', '=in=']
-    has_operator = any(op in query for op in operators)
-    
-    return has_operator
+    return _OP_RE.search(query) is not None
 
 
 def sanitize_fiql(query: str) -> str:
@@ -330,15 +343,9 @@ def sanitize_fiql(query: str) -> str:
         return ""
     
     # Remove any script-like content
-    query = re.sub(r'<script.*?</script>', '', query, flags=re.IGNORECASE | re.DOTALL)
+    query = _SCRIPT_RE.sub('', query)
     
     # Remove SQL injection attempts
-    dangerous_patterns = [
-        r'\bDROP\b', r'\bDELETE\b', r'\bINSERT\b', r'\bUPDATE\b',
-        r'\bUNION\b', r'\bSELECT\b', r'\bEXEC\b'
-    ]
-    
-    for pattern in dangerous_patterns:
-        query = re.sub(pattern, '', query, flags=re.IGNORECASE)
+    query = _SQL_RE.sub('', query)
     
     return query.strip()
\ No newline at end of file
@@ -3,26 +3,63 @@
 import logging
 import time
 from contextlib import asynccontextmanager
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+
+import orjson
 
 from fastapi import FastAPI, HTTPException, Request, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 
-from .config import settings
-from .schemas import QueryRequest, QueryResponse, ErrorResponse, HealthResponse
+from .config import settings, settings_snapshot
+from .schemas import QueryRequest, QueryResponse, ErrorResponse, HealthResponse, ServiceInfoResponse
 from .router import query_router
+from .planning import load_warmup_queries
 from .security import security_manager, get_client_ip
+from .tools.topdesk_client import TopdeskMCPClient, get_client, close_client
 from .validators import ValidationError, validate_query_text, ensure_limit
 
 
-# Configure logging
+# Configure logging (level resolved once at import)
+_LOG_LEVEL_NAME = settings.log_level.upper()
+_LOG_LEVEL = getattr(logging, _LOG_LEVEL_NAME, logging.INFO)
+
 logging.basicConfig(
-    level=getattr(logging, settings.log_level.upper()),
+    level=_LOG_LEVEL,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
 
+# Rate limit header value that never changes at runtime
+_RATE_LIMIT_HEADER = str(settings_snapshot.rate_limit_requests)
+
+# Static body for the root endpoint, serialized once at import
+_ROOT_BODY = orjson.dumps({
+    "service": "Natural Language → TOPdesk MCP Router",
+    "version": "1.0.0",
+    "description": "Convert natural language queries to TOPdesk MCP tool calls",
+    "endpoints": {
+        "query": "POST /ask",
+        "health": "GET /health",
+        "status": "GET /status"
+    }
+})
+
+
+def _mask_ip(client_ip: str) -> str:
+    """Return a partial client IP that is safe to log."""
+    return client_ip[:8] + "***"
+
+
+async def _connect_mcp_client(app: FastAPI) -> TopdeskMCPClient:
+    """Return the app's MCP client, connecting the shared one if needed."""
+    mcp_client = getattr(app.state, "mcp_client", None)
+    if mcp_client is None:
+        mcp_client = await get_client()
+        app.state.mcp_client = mcp_client
+        query_router.mcp_client = mcp_client
+    return mcp_client
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -31,7 +68,25 @@ async def lifespan(app: FastAPI):
     logger.info(f"MCP Base URL: {settings.mcp_base_url}")
     logger.info(f"Log Level: {settings.log_level}")
     
-    yield
+    # Warm the planner before accepting traffic
+    if settings.planner_warmup_file:
+        warmed = query_router.planner.warm_up(load_warmup_queries(settings.planner_warmup_file))
+        logger.info(f"Planner warmed with {warmed} queries")
+    
+    # Shared MCP client so queries, health probes and the client helpers
+    # reuse pooled connections. An unreachable backend must not stop the app
+    # from starting; the health endpoints retry and report it instead.
+    app.state.mcp_client = None
+    try:
+        await _connect_mcp_client(app)
+    except Exception as e:
+        logger.warning(f"MCP client not connected at startup: {e}")
+    try:
+        yield
+    finally:
+        app.state.mcp_client = None
+        query_router.mcp_client = None
+        await close_client()
     
     logger.info("Shutting down Natural Language → TOPdesk MCP Router")
 
@@ -41,7 +96,8 @@ app = FastAPI(
     title="Natural Language → TOPdesk MCP Router",
     description="FastAPI service that converts natural language queries to TOPdesk MCP tool calls",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -55,88 +111,92 @@ app.add_middleware(
 
 
 # Rate limiting dependency
-async def check_rate_limit(request: Request):
-    """Check rate limiting for incoming requests."""
-    client_ip = get_client_ip(request)
+async def check_rate_limit(request: Request) -> Tuple[str, int]:
+    """Check rate limiting for incoming requests.
+    
+    Returns:
+        Tuple of (client IP, remaining requests)
+    """
+    # Resolved once per request by the log_requests middleware
+    client_ip = getattr(request.state, "client_ip", None) or get_client_ip(request)
     
-    if not await security_manager.check_rate_limit(client_ip):
-        remaining = await security_manager.get_rate_limit_remaining(client_ip)
+    allowed, remaining = await security_manager.check_rate_limit_and_remaining(client_ip)
+    if not allowed:
         raise HTTPException(
             status_code=429,
             detail={
                 "error": "Rate limit exceeded",
-                "message": f"Too many requests. Limit: {settings.rate_limit_requests} per {settings.rate_limit_window}s",
+                "message": f"Too many requests. Limit: {settings_snapshot.rate_limit_requests} per {settings_snapshot.rate_limit_window}s",
                 "remaining": remaining,
-                "retry_after": settings.rate_limit_window
+                "retry_after": settings_snapshot.rate_limit_window
             }
         )
     
-    return client_ip
+    return client_ip, remaining
 
 
 @app.exception_handler(ValidationError)
 async def validation_exception_handler(request: Request, exc: ValidationError):
     """Handle validation errors."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=400,
         content=ErrorResponse(
             error="Validation Error",
             code=400,
             details={"message": str(exc)}
-        ).dict()
+        ).model_dump()
     )
 
 
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
     """Handle HTTP exceptions."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content=ErrorResponse(
             error="HTTP Error",
             code=exc.status_code,
             details=exc.detail if isinstance(exc.detail, dict) else {"message": str(exc.detail)}
-        ).dict()
+        ).model_dump()
     )
 
 
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle general exceptions."""
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    # Traceback formatting is expensive; only include it when explicitly enabled
+    logger.error(
+        f"Unhandled exception: {type(exc).__name__}: {exc}",
+        exc_info=settings_snapshot.debug_tracebacks
+    )
+    return ORJSONResponse(
         status_code=500,
         content=ErrorResponse(
             error="Internal Server Error",
             code=500,
             details={"message": "An internal error occurred"}
-        ).dict()
+        ).model_dump()
     )
 
 
-@app.get("/", response_model=Dict[str, str])
+@app.get("/", response_model=ServiceInfoResponse)
 async def root():
     """Root endpoint with basic information."""
-    return {
-        "service": "Natural Language → TOPdesk MCP Router",
-        "version": "1.0.0",
-        "description": "Convert natural language queries to TOPdesk MCP tool calls",
-        "endpoints": {
-            "query": "POST /ask",
-            "health": "GET /health",
-            "status": "GET /status"
-        }
-    }
+    # A fresh response per request; the framework sets attributes on it
+    return Response(
+        content=_ROOT_BODY,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=3600"}
+    )
 
 
 @app.get("/health", response_model=HealthResponse)
-async def health_check():
+async def health_check(request: Request):
     """Health check endpoint."""
     try:
         # Check MCP connectivity
-        from .tools.topdesk_client import TopdeskMCPClient
-        async with TopdeskMCPClient() as client:
-            health_info = await client.health_check()
+        mcp_client = await _connect_mcp_client(request.app)
+        health_info = await mcp_client.health_check()
         
         mcp_status = health_info.get("status", "unknown")
         
@@ -156,15 +216,14 @@ async def health_check():
 
 
 @app.get("/status", response_model=Dict[str, Any])
-async def get_status():
+async def get_status(request: Request):
     """Get detailed service status including security status."""
     try:
         security_status = await security_manager.get_status()
         
         # Check MCP connectivity
-        from .tools.topdesk_client import TopdeskMCPClient
-        async with TopdeskMCPClient() as client:
-            mcp_health = await client.health_check()
+        mcp_client = await _connect_mcp_client(request.app)
+        mcp_health = await mcp_client.health_check()
         
         return {
             "service": {
@@ -200,7 +259,7 @@ async def get_status():
 @app.post("/ask", response_model=QueryResponse)
 async def process_natural_language_query(
     request: QueryRequest,
-    client_ip: str = Depends(check_rate_limit)
+    rate_limit: Tuple[str, int] = Depends(check_rate_limit)
 ):
     """Process a natural language query and return structured results.
     
@@ -211,30 +270,29 @@ async def process_natural_language_query(
     4. Normalizes and summarizes the results
     5. Returns structured response with plan, results, and summary
     """
-    start_time = time.time()
+    start_time = time.monotonic()
+    client_ip, remaining = rate_limit
     
     try:
         # Additional validation beyond Pydantic
         validate_query_text(request.query)
-        ensure_limit(request.max_results, settings.max_allowed_results)
+        ensure_limit(request.max_results, settings_snapshot.max_allowed_results)
         
-        logger.info(f"Processing query from {client_ip[:8]}***", extra={
+        masked_ip = _mask_ip(client_ip)
+        logger.info(f"Processing query from {masked_ip}", extra={
             "query_length": len(request.query),
             "max_results": request.max_results,
-            "client_ip": client_ip[:8] + "***"
+            "client_ip": masked_ip
         })
         
         # Process the query
         response = await query_router.process_query(request, client_ip)
         
-        # Add rate limit headers
-        remaining = await security_manager.get_rate_limit_remaining(client_ip)
-        
         # Create custom response with headers
-        json_response = JSONResponse(content=response.dict())
-        json_response.headers["X-RateLimit-Limit"] = str(settings.rate_limit_requests)
+        json_response = ORJSONResponse(content=response.model_dump(mode="json"))
+        json_response.headers["X-RateLimit-Limit"] = _RATE_LIMIT_HEADER
         json_response.headers["X-RateLimit-Remaining"] = str(remaining)
-        json_response.headers["X-RateLimit-Reset"] = str(int(time.time() + settings.rate_limit_window))
+        json_response.headers["X-RateLimit-Reset"] = f"{int(time.time()) + settings_snapshot.rate_limit_window}"
         
         return json_response
     
@@ -243,8 +301,8 @@ async def process_natural_language_query(
     
     except Exception as e:
         logger.error(f"Query processing failed: {e}", extra={
-            "client_ip": client_ip[:8] + "***",
-            "execution_time": time.time() - start_time
+            "client_ip": _mask_ip(client_ip),
+            "execution_time": time.monotonic() - start_time
         })
         raise HTTPException(status_code=500, detail="Query processing failed")
 
@@ -253,26 +311,32 @@ async def process_natural_language_query(
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     """Log all incoming requests."""
-    start_time = time.time()
-    client_ip = get_client_ip(request)
+    start_time = time.monotonic()
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
     
-    # Log request
-    logger.debug(f"Request: {request.method} {request.url.path}", extra={
-        "client_ip": client_ip[:8] + "***",
-        "method": request.method,
-        "path": request.url.path
-    })
+    # Resolve the client IP once and share it with request handlers
+    request.state.client_ip = get_client_ip(request)
+    
+    # Log request (skip building log extras unless DEBUG is enabled)
+    if debug_enabled:
+        masked_ip = _mask_ip(request.state.client_ip)
+        logger.debug(f"Request: {request.method} {request.url.path}", extra={
+            "client_ip": masked_ip,
+            "method": request.method,
+            "path": request.url.path
+        })
     
     # Process request
     response = await call_next(request)
     
     # Log response
-    process_time = time.time() - start_time
-    logger.debug(f"Response: {response.status_code}", extra={
-        "client_ip": client_ip[:8] + "***",
-        "status_code": response.status_code,
-        "process_time": process_time
-    })
+    process_time = time.monotonic() - start_time
+    if debug_enabled:
+        logger.debug(f"Response: {response.status_code}", extra={
+            "client_ip": masked_ip,
+            "status_code": response.status_code,
+            "process_time": process_time
+        })
     
     # Add timing header
     response.headers["X-Process-Time"] = str(process_time)
@@ -287,5 +351,5 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=True,
-        log_level=settings.log_level.lower()
+        log_level=_LOG_LEVEL_NAME.lower()
     )
\ No newline at end of file
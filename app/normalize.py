@@ -1,13 +1,51 @@
 """Data normalization utilities for MCP responses."""
 
 import logging
-from typing import Dict, Any, List, Optional
+import re
+from functools import lru_cache
+from typing import Dict, Any, Iterator, List, Optional
 from datetime import datetime
 from .schemas import NormalizedIncident
 
 
 logger = logging.getLogger(__name__)
 
+# Common TOPdesk datetime formats, tried in order
+_DT_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S.%fZ",      # ISO with microseconds
+    "%Y-%m-%dT%H:%M:%SZ",         # ISO without microseconds
+    "%Y-%m-%dT%H:%M:%S",          # ISO without timezone
+    "%Y-%m-%d %H:%M:%S",          # Space separated
+    "%Y-%m-%d"                    # Date only
+)
+
+# Output format for normalized datetimes
+_OUT_FMT = "%Y-%m-%d %H:%M:%S"
+
+# The _DT_FORMATS shapes with optionally unpadded fields, matched in one pass
+_DT_RE = re.compile(
+    r'([0-9]{4})-([0-9]{1,2})-([0-9]{1,2})'
+    r'(?:([T ])([0-9]{1,2}):([0-9]{1,2}):([0-9]{1,2})(\.[0-9]{1,6}Z|Z)?)?'
+)
+
+# Status reported when an incident has none
+_UNKNOWN_STATUS = "Unknown"
+
+# Key fragments (lowercase) removed from logged data as PII
+_PII_FIELDS = frozenset({
+    'password', 'api_key', 'token', 'secret', 'credential',
+    'email', 'phone', 'ssn', 'address', 'personaldetails'
+})
+
+# Key fragments (lowercase) whose string values are truncated when logged
+_TRUNCATE_FIELDS = frozenset({
+    'briefdescription', 'request', 'action', 'memo'
+})
+
+# Single-pass substring matchers for the field sets above
+_PII_RE = re.compile('|'.join(map(re.escape, sorted(_PII_FIELDS))))
+_TRUNCATE_RE = re.compile('|'.join(map(re.escape, sorted(_TRUNCATE_FIELDS))))
+
 
 def safe_get(data: Dict[str, Any], *keys: str, default: Any = None) -> Any:
     """Safely get nested dictionary values.
@@ -20,15 +58,33 @@ def safe_get(data: Dict[str, Any], *keys: str, default: Any = None) -> Any:
     Returns:
         Value at the key path or default
     """
+    # Single-key lookups dominate; answer them with one dict.get
+    if len(keys) == 1:
+        return data.get(keys[0], default) if isinstance(data, dict) else default
+    
     current = data
-    for key in keys:
-        if isinstance(current, dict) and key in current:
+    try:
+        for key in keys:
             current = current[key]
-        else:
-            return default
+    except (KeyError, TypeError):
+        return default
     return current
 
 
+def _get_field(data: Any, key: str, default: Any = None) -> Any:
+    """Single-key variant of safe_get without the variadic key tuple.
+    
+    Args:
+        data: Dictionary to extract from (any other type yields the default)
+        key: Key to look up
+        default: Default value if key not found
+        
+    Returns:
+        Value for the key or default
+    """
+    return data.get(key, default) if isinstance(data, dict) else default
+
+
 def normalize_datetime(dt_str: Optional[str]) -> str:
     """Normalize datetime string to consistent format.
     
@@ -41,20 +97,36 @@ def normalize_datetime(dt_str: Optional[str]) -> str:
     if not dt_str:
         return ""
     
+    if not isinstance(dt_str, str):
+        # Non-string values cannot be parsed (or cached); keep them as text
+        return str(dt_str)
+    
+    return _normalize_datetime_cached(dt_str)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_datetime_cached(dt_str: str) -> str:
+    """Parse and reformat a non-empty datetime string.
+    
+    Incident batches repeat the same timestamps, so results are cached per
+    raw string. The cache is bounded to keep memory flat on unique inputs.
+    """
+    # Fast path: strict ISO-8601 shapes are reformatted by slicing
+    fast = _format_iso_datetime(dt_str)
+    if fast is not None:
+        return fast
+    
+    # Unpadded fields are handled by a single regex match
+    matched = _match_datetime(dt_str)
+    if matched is not None:
+        return matched
+    
     try:
-        # Try parsing common TOPdesk datetime formats
-        formats = [
-            "%Y-%m-%dT%H:%M:%S.%fZ",      # ISO with microseconds
-            "%Y-%m-%dT%H:%M:%SZ",         # ISO without microseconds  
-            "%Y-%m-%dT%H:%M:%S",          # ISO without timezone
-            "%Y-%m-%d %H:%M:%S",          # Space separated
-            "%Y-%m-%d"                    # Date only
-        ]
-        
-        for fmt in formats:
+        # Remaining inputs go through the full strptime rules
+        for fmt in _DT_FORMATS:
             try:
                 dt = datetime.strptime(dt_str, fmt)
-                return dt.strftime("%Y-%m-%d %H:%M:%S")
+                return dt.strftime(_OUT_FMT)
             except ValueError:
                 continue
         
@@ -63,7 +135,101 @@ def normalize_datetime(dt_str: Optional[str]) -> str:
     
     except Exception as e:
         logger.warning(f"Failed to normalize datetime '{dt_str}': {e}")
-        return str(dt_str) if dt_str else ""
+        return str(dt_str)
+
+
+def _match_datetime(dt_str: str) -> Optional[str]:
+    """Reformat a supported datetime whose fields may be unpadded.
+    
+    Args:
+        dt_str: DateTime string to reformat
+        
+    Returns:
+        Normalized datetime string, or None if the input does not match
+    """
+    match = _DT_RE.fullmatch(dt_str)
+    if match is None:
+        return None
+    
+    year, month, day, separator, hour, minute, second, suffix = match.groups()
+    if separator == ' ' and suffix:
+        # Space-separated timestamps carry no timezone or fraction
+        return None
+    
+    try:
+        dt = datetime(int(year), int(month), int(day),
+                      int(hour or 0), int(minute or 0), int(second or 0))
+    except ValueError:
+        return None
+    
+    return f"{year}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+
+
+def _format_iso_datetime(dt_str: str) -> Optional[str]:
+    """Reformat the supported ISO-8601 shapes without calling strptime.
+    
+    Accepts exactly the inputs of the strptime formats in
+    normalize_datetime when written with zero-padded fields, i.e.
+    ``YYYY-MM-DD``, ``YYYY-MM-DD HH:MM:SS`` and
+    ``YYYY-MM-DDTHH:MM:SS[.ffffff][Z]``.
+    
+    Args:
+        dt_str: DateTime string to reformat
+        
+    Returns:
+        Normalized datetime string, or None if the input needs full parsing
+    """
+    length = len(dt_str)
+    if length < 10 or dt_str[4] != '-' or dt_str[7] != '-':
+        return None
+    
+    if length == 10:
+        time_part = "00:00:00"
+    elif length >= 19 and dt_str[13] == ':' and dt_str[16] == ':':
+        separator = dt_str[10]
+        tail = dt_str[19:]
+        if separator == 'T':
+            # Optional fraction (1-6 digits) is only valid with a trailing Z
+            if tail and tail != 'Z' and not (
+                tail[0] == '.' and tail[-1] == 'Z' and 3 <= len(tail) <= 8
+                and tail[1:-1].isdigit()
+            ):
+                return None
+        elif separator != ' ' or tail:
+            return None
+        time_part = dt_str[11:19]
+    else:
+        return None
+    
+    digits = dt_str[:4] + dt_str[5:7] + dt_str[8:10] + time_part[:2] + time_part[3:5] + time_part[6:8]
+    if not (digits.isascii() and digits.isdigit()):
+        return None
+    
+    # Reject out-of-range fields exactly like strptime would
+    try:
+        datetime(int(digits[:4]), int(digits[4:6]), int(digits[6:8]),
+                 int(digits[8:10]), int(digits[10:12]), int(digits[12:14]))
+    except ValueError:
+        return None
+    
+    return f"{dt_str[:10]} {time_part}"
+
+
+def _name_or_str(value: Any, default: Optional[str] = None) -> Optional[str]:
+    """Get the display name of a field that is either an object or a string.
+    
+    Args:
+        value: Field value, a dict with a "name" key or a scalar
+        default: Value to use when the field is empty
+        
+    Returns:
+        The object's name, the string itself, or the default
+    """
+    if isinstance(value, dict):
+        return value.get("name", default)
+    if isinstance(value, str):
+        return value or default
+    return str(value) if value else default
 
 
 def normalize_person_name(person_data: Optional[Dict[str, Any]]) -> str:
@@ -78,15 +244,15 @@ def normalize_person_name(person_data: Optional[Dict[str, Any]]) -> str:
     if not person_data or not isinstance(person_data, dict):
         return ""
     
-    # Try different name field combinations
-    first_name = safe_get(person_data, "firstName", default="").strip()
-    last_name = safe_get(person_data, "surname", default="").strip()
-    display_name = safe_get(person_data, "dynamicName", default="").strip()
-    
-    # Use display name if available
+    # Use display name if available (the standard TOPdesk field)
+    display_name = (person_data.get("dynamicName") or "").strip()
     if display_name:
         return display_name
     
+    # Try different name field combinations
+    first_name = (person_data.get("firstName") or "").strip()
+    last_name = (person_data.get("surname") or "").strip()
+    
     # Combine first and last name
     if first_name and last_name:
         return f"{first_name} {last_name}"
@@ -96,12 +262,14 @@ def normalize_person_name(person_data: Optional[Dict[str, Any]]) -> str:
         return last_name
     
     # Fallback to other name fields
-    return safe_get(person_data, "name", default="")
+    return person_data.get("name", "")
 
 
 def normalize_incident(incident_data: Dict[str, Any]) -> NormalizedIncident:
     """Normalize a single incident from TOPdesk API response.
     
+    Falls back to a minimal incident if the data cannot be normalized.
+    
     Args:
         incident_data: Raw incident data from TOPdesk
         
@@ -109,65 +277,19 @@ def normalize_incident(incident_data: Dict[str, Any]) -> NormalizedIncident:
         Normalized incident object
     """
     try:
-        # Extract basic fields with safe defaults
-        incident_id = safe_get(incident_data, "id", default="")
-        number = safe_get(incident_data, "number", default="")
-        title = safe_get(incident_data, "briefDescription", default="")
-        
-        # Handle status - could be string or object
-        status_data = safe_get(incident_data, "status")
-        if isinstance(status_data, dict):
-            status = safe_get(status_data, "name", default="Unknown")
-        else:
-            status = str(status_data) if status_data else "Unknown"
-        
-        # Handle creation date
-        created_at = normalize_datetime(safe_get(incident_data, "creationDate"))
-        
-        # Handle priority - could be string or object
-        priority_data = safe_get(incident_data, "priority")
-        if isinstance(priority_data, dict):
-            priority = safe_get(priority_data, "name")
-        else:
-            priority = str(priority_data) if priority_data else None
-        
-        # Handle caller - could be string or object
-        caller_data = safe_get(incident_data, "caller")
-        caller = normalize_person_name(caller_data) if caller_data else None
-        
-        # Handle operator - could be string or object
-        operator_data = safe_get(incident_data, "operator")
-        operator = normalize_person_name(operator_data) if operator_data else None
-        
-        # Handle operator group
-        operator_group_data = safe_get(incident_data, "operatorGroup")
-        if isinstance(operator_group_data, dict):
-            operator_group = safe_get(operator_group_data, "name")
-        else:
-            operator_group = str(operator_group_data) if operator_group_data else None
-        
-        return NormalizedIncident(
-            id=str(incident_id),
-            number=str(number),
-            title=str(title),
-            status=status,
-            created_at=created_at,
-            priority=priority,
-            caller=caller,
-            operator=operator,
-            operator_group=operator_group
-        )
+        return _normalize_incident_fast(incident_data)
     
     except Exception as e:
         logger.error(f"Failed to normalize incident: {e}")
-        logger.debug(f"Incident data: {incident_data}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Incident data: {incident_data}")
         
         # Return minimal incident with available data
         return NormalizedIncident(
-            id=safe_get(incident_data, "id", default="unknown"),
-            number=safe_get(incident_data, "number", default="unknown"),
-            title=safe_get(incident_data, "briefDescription", default="Error normalizing incident"),
-            status="Unknown",
+            id=_get_field(incident_data, "id", "unknown"),
+            number=_get_field(incident_data, "number", "unknown"),
+            title=_get_field(incident_data, "briefDescription", "Error normalizing incident"),
+            status=_UNKNOWN_STATUS,
             created_at="",
             priority=None,
             caller=None,
@@ -176,6 +298,107 @@ def normalize_incident(incident_data: Dict[str, Any]) -> NormalizedIncident:
         )
 
 
+def _normalize_incident_fast(incident_data: Dict[str, Any]) -> NormalizedIncident:
+    """Normalize a single incident without any error handling.
+    
+    Args:
+        incident_data: Raw incident data from TOPdesk
+        
+    Returns:
+        Normalized incident object
+        
+    Raises:
+        Exception: If the incident data is malformed
+    """
+    # Extract basic fields with safe defaults
+    get = incident_data.get
+    incident_id = get("id") or ""
+    number = get("number") or ""
+    title = get("briefDescription") or ""
+    
+    # Handle status - could be string or object
+    status = _name_or_str(get("status"), _UNKNOWN_STATUS)
+    
+    # Handle creation date
+    created_at = normalize_datetime(get("creationDate"))
+    
+    # Handle priority - could be string or object
+    priority = _name_or_str(get("priority"))
+    
+    # Handle caller - could be string or object
+    caller_data = get("caller")
+    caller = normalize_person_name(caller_data) if caller_data else None
+    
+    # Handle operator - could be string or object
+    operator_data = get("operator")
+    operator = normalize_person_name(operator_data) if operator_data else None
+    
+    # Handle operator group
+    operator_group = _name_or_str(get("operatorGroup"))
+    
+    return NormalizedIncident(
+        id=str(incident_id),
+        number=str(number),
+        title=str(title),
+        status=status,
+        created_at=created_at,
+        priority=priority,
+        caller=caller,
+        operator=operator,
+        operator_group=operator_group
+    )
+
+
+def _extract_incident_list(response: Any) -> List[Any]:
+    """Locate the list of raw incidents in an MCP response.
+    
+    Args:
+        response: Raw MCP response containing incidents
+        
+    Returns:
+        List of raw incident entries (empty for unexpected responses)
+    """
+    # Handle different response structures
+    if isinstance(response, list):
+        # Direct list of incidents
+        return response
+    
+    if isinstance(response, dict):
+        # Check for common response structures
+        return (
+            response.get("incidents") or
+            response.get("data") or
+            response.get("results") or
+            []
+        )
+    
+    logger.warning(f"Unexpected response type: {type(response)}")
+    return []
+
+
+def iter_normalized_incidents(response: Any) -> Iterator[NormalizedIncident]:
+    """Yield normalized incidents from an MCP response one at a time.
+    
+    Streaming counterpart of normalize_incidents_response for consumers
+    that iterate once and do not need the whole list in memory.
+    
+    Args:
+        response: Raw MCP response containing incidents
+        
+    Yields:
+        Normalized incidents, skipping non-dict entries
+    """
+    skipped = 0
+    for incident_data in _extract_incident_list(response):
+        if isinstance(incident_data, dict):
+            yield normalize_incident(incident_data)
+        else:
+            skipped += 1
+    
+    if skipped:
+        logger.warning(f"Skipping {skipped} non-dict incident(s)")
+
+
 def normalize_incidents_response(response: Dict[str, Any]) -> List[NormalizedIncident]:
     """Normalize incidents from MCP response.
     
@@ -188,33 +411,31 @@ def normalize_incidents_response(response: Dict[str, Any]) -> List[NormalizedInc
     incidents = []
     
     try:
-        # Handle different response structures
-        if isinstance(response, list):
-            # Direct list of incidents
-            incident_list = response
-        elif isinstance(response, dict):
-            # Check for common response structures
-            incident_list = (
-                safe_get(response, "incidents", default=[]) or
-                safe_get(response, "data", default=[]) or 
-                safe_get(response, "results", default=[]) or
-                []
-            )
-        else:
-            logger.warning(f"Unexpected response type: {type(response)}")
-            return incidents
+        incident_list = _extract_incident_list(response)
         
-        # Normalize each incident
-        for incident_data in incident_list:
-            if isinstance(incident_data, dict):
-                normalized = normalize_incident(incident_data)
-                incidents.append(normalized)
-            else:
-                logger.warning(f"Skipping non-dict incident: {type(incident_data)}")
+        # Normalize each incident, retrying with per-incident fallbacks
+        # only if some incident in the batch is malformed
+        try:
+            incidents = [
+                _normalize_incident_fast(incident_data)
+                for incident_data in incident_list
+                if isinstance(incident_data, dict)
+            ]
+        except Exception:
+            incidents = [
+                normalize_incident(incident_data)
+                for incident_data in incident_list
+                if isinstance(incident_data, dict)
+            ]
+        
+        skipped = len(incident_list) - len(incidents)
+        if skipped:
+            logger.warning(f"Skipping {skipped} non-dict incident(s)")
     
     except Exception as e:
         logger.error(f"Failed to normalize incidents response: {e}")
-        logger.debug(f"Response data: {response}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Response data: {response}")
     
     return incidents
 
@@ -239,9 +460,9 @@ def normalize_person_response(response: Dict[str, Any]) -> Optional[Dict[str, st
             else:
                 # Check for nested person data
                 person_list = (
-                    safe_get(response, "persons", default=[]) or
-                    safe_get(response, "data", default=[]) or
-                    safe_get(response, "results", default=[])
+                    response.get("persons") or
+                    response.get("data") or
+                    response.get("results")
                 )
                 
                 if person_list and len(person_list) > 0:
@@ -250,12 +471,13 @@ def normalize_person_response(response: Dict[str, Any]) -> Optional[Dict[str, st
         if not person_data:
             return None
         
+        get = person_data.get
         return {
-            "id": safe_get(person_data, "id", default=""),
+            "id": get("id") or "",
             "name": normalize_person_name(person_data),
-            "email": safe_get(person_data, "email", default=""),
-            "firstName": safe_get(person_data, "firstName", default=""),
-            "surname": safe_get(person_data, "surname", default="")
+            "email": get("email") or "",
+            "firstName": get("firstName") or "",
+            "surname": get("surname") or ""
         }
     
     except Exception as e:
@@ -283,9 +505,9 @@ def normalize_operator_response(response: Dict[str, Any]) -> Optional[Dict[str,
             else:
                 # Check for nested operator data
                 operator_list = (
-                    safe_get(response, "operators", default=[]) or
-                    safe_get(response, "data", default=[]) or
-                    safe_get(response, "results", default=[])
+                    response.get("operators") or
+                    response.get("data") or
+                    response.get("results")
                 )
                 
                 if operator_list and len(operator_list) > 0:
@@ -294,11 +516,12 @@ def normalize_operator_response(response: Dict[str, Any]) -> Optional[Dict[str,
         if not operator_data:
             return None
         
+        get = operator_data.get
         return {
-            "id": safe_get(operator_data, "id", default=""),
-            "name": safe_get(operator_data, "name", default=""),
-            "firstName": safe_get(operator_data, "firstName", default=""),
-            "surname": safe_get(operator_data, "surname", default="")
+            "id": get("id") or "",
+            "name": get("name") or "",
+            "firstName": get("firstName") or "",
+            "surname": get("surname") or ""
         }
     
     except Exception as e:
@@ -309,6 +532,9 @@ def normalize_operator_response(response: Dict[str, Any]) -> Optional[Dict[str,
 def sanitize_for_logging(data: Any, max_depth: int = 3) -> Any:
     """Sanitize data for safe logging by removing PII and limiting depth.
     
+    Traverses with an explicit stack rather than recursion; each pending
+    entry records where its sanitized value must be stored.
+    
     Args:
         data: Data to sanitize
         max_depth: Maximum nesting depth to preserve
@@ -316,45 +542,47 @@ def sanitize_for_logging(data: Any, max_depth: int = 3) -> Any:
     Returns:
         Sanitized data safe for logging
     """
-    if max_depth <= 0:
-        return "..."
+    root = [None]
+    stack = [(data, max_depth, root, 0)]
     
-    if isinstance(data, dict):
-        sanitized = {}
+    while stack:
+        value, depth, container, slot = stack.pop()
         
-        # Fields to completely remove (PII)
-        pii_fields = {
-            'password', 'api_key', 'token', 'secret', 'credential',
-            'email', 'phone', 'ssn', 'address', 'personalDetails'
-        }
+        if depth <= 0:
+            container[slot] = "..."
         
-        # Fields to truncate
-        truncate_fields = {
-            'briefDescription', 'request', 'action', 'memo'
-        }
-        
-        for key, value in data.items():
-            key_lower = key.lower()
-            
-            # Skip PII fields
-            if any(pii in key_lower for pii in pii_fields):
-                continue
+        elif isinstance(value, dict):
+            sanitized = {}
+            container[slot] = sanitized
             
-            # Truncate long text fields
-            if any(field in key_lower for field in truncate_fields) and isinstance(value, str):
-                sanitized[key] = value[:100] + "..." if len(value) > 100 else value
-            else:
-                sanitized[key] = sanitize_for_logging(value, max_depth - 1)
+            for key, item in value.items():
+                key_lower = key.lower()
+                
+                # Skip PII fields
+                if _PII_RE.search(key_lower):
+                    continue
+                
+                # Truncate long text fields
+                if isinstance(item, str) and _TRUNCATE_RE.search(key_lower):
+                    sanitized[key] = item[:100] + "..." if len(item) > 100 else item
+                else:
+                    # Reserve the key now so the output keeps the input order
+                    sanitized[key] = None
+                    stack.append((item, depth - 1, sanitized, key))
         
-        return sanitized
-    
-    elif isinstance(data, list):
-        # Limit list size for logging
-        return [sanitize_for_logging(item, max_depth - 1) for item in data[:5]]
-    
-    elif isinstance(data, str) and len(data) > 200:
-        # Truncate very long strings
-        return data[:200] + "..."
+        elif isinstance(value, list):
+            # Limit list size for logging
+            items = value[:5]
+            sanitized = [None] * len(items)
+            container[slot] = sanitized
+            for index, item in enumerate(items):
+                stack.append((item, depth - 1, sanitized, index))
+        
+        elif isinstance(value, str) and len(value) > 200:
+            # Truncate very long strings
+            container[slot] = value[:200] + "..."
+        
+        else:
+            container[slot] = value
     
-    else:
-        return data
\ No newline at end of file
+    return root[0]
@@ -2,13 +2,15 @@
 
 import re
 import logging
-from typing import List, Optional, Tuple, Dict, Any
-from datetime import datetime, timedelta
+from enum import IntFlag
+from functools import lru_cache
+from typing import Iterable, List, NamedTuple, Optional, Sequence, Tuple, Dict, Any
+from datetime import datetime, timedelta, timezone
 
 from .schemas import QueryPlan, PlanStep, ToolCall
 from .fiql import (
-    build_person_query, build_operator_query, build_incident_query,
-    days_ago, and_join
+    build_person_query_from_parts, build_operator_query, build_incident_query,
+    days_ago, and_join, in_list
 )
 from .validators import validate_incident_number, ValidationError
 
@@ -16,54 +18,181 @@ from .validators import validate_incident_number, ValidationError
 logger = logging.getLogger(__name__)
 
 
+def _compile_all(patterns: List[str], flags: int = 0) -> Tuple[re.Pattern, ...]:
+    """Compile patterns into a tuple."""
+    return tuple(re.compile(pattern, flags) for pattern in patterns)
+
+
+# Common patterns for intent detection, compiled once at import. plan_query
+# lower-cases queries before matching, so most patterns are written in lower
+# case and compiled without re.IGNORECASE, which makes every search noticeably
+# cheaper. The name and category extractors keep re.IGNORECASE so they also
+# accept queries as typed.
+_PERSON_PATTERNS = _compile_all([
+    r'\b(?:tickets?|incidents?|issues?)\s+(?:of|from|by|for)\s+([A-Za-z][A-Za-z\s]+[A-Za-z])',
+    r'\b([A-Za-z][A-Za-z\s]+[A-Za-z])\'s?\s+(?:tickets?|incidents?|issues?)',
+    r'\b(?:user|person|caller)\s+([A-Za-z][A-Za-z\s]+[A-Za-z])',
+], re.IGNORECASE)
+
+_OPERATOR_PATTERNS = _compile_all([
+    r'\b(?:assigned\s+to|operator|technician)\s+([A-Za-z\s]+)',
+    r'\b([A-Za-z\s]+)\s+(?:is\s+)?(?:working\s+on|handling)',
+], re.IGNORECASE)
+
+_STATUS_PATTERNS = _compile_all([
+    r'\b(open|closed|resolved|pending|new)\s+(?:tickets?|incidents?)',
+    r'\b(?:tickets?|incidents?)\s+(?:that\s+are\s+)?(open|closed|resolved|pending|new)',
+    r'\bstatus\s*[=:]\s*(open|closed|resolved|pending|new)'
+])
+
+# "<level> priority", "priority: <level>" or "<level> tickets/incidents"
+_PRIORITY_RE = re.compile(
+    r'\b(?:(critical|urgent|high|medium|low)\s+(?:priority|tickets?|incidents?)'
+    r'|priority\s*[=:]\s*(critical|urgent|high|medium|low))'
+)
+
+# Map to standard priority names, as shared immutable filters
+_PRIORITY_FILTERS = {
+    'critical': ('Critical',), 'urgent': ('Critical',),
+    'high': ('High',), 'medium': ('Medium',), 'low': ('Low',),
+}
+
+_CATEGORY_PATTERNS = _compile_all([
+    r'\b(change|rfc|request\s+for\s+change|wijziging|verandering)s?\b',
+    r'\b(wijzigingen|veranderingen)s?\b',  # Dutch plurals
+    r'\bcategory\s*[=:]\s*([A-Za-z\s]+)',
+], re.IGNORECASE)
+
+# TOPdesk incident format; the "incident"/"ticket" prefixed forms are subsets
+_INCIDENT_ID_RE = re.compile(r'\b([Ii]-\d{6}-\d{3})\b')
+
+# Relative time expressions, all in one alternation
+_TIME_RE = re.compile(
+    r'\b(?:(today|yesterday)\b'
+    r'|(this|last)\s+(week|month)'
+    r'|(?:last|past|recent)\s+(\d+)\s+(day|week|month)s?'
+    r'|(\d+)\s+(day|week|month)s?\s+ago)'
+)
+
+_TIME_LITERAL_DAYS = {
+    'today': 1, 'yesterday': 2,
+    'this week': 7, 'last week': 14,
+    'this month': 30, 'last month': 60,
+}
+
+_TIME_UNIT_DAYS = {'day': 1, 'week': 7, 'month': 30}
+
+
+class _Intent(IntFlag):
+    """Intents whose keywords were seen in a query."""
+    
+    NONE = 0
+    PERSON = 1
+    OPERATOR = 2
+    INCIDENT_ID = 4
+    STATUS = 8
+    PRIORITY = 16
+    CATEGORY = 32
+    TIME = 64
+
+
+# Literal keywords each extractor's patterns cannot match without. A single
+# scan collects the intents present so extractors without hits are skipped.
+_INTENT_KEYWORDS = {
+    _Intent.PERSON: ('ticket', 'incident', 'issue', 'user', 'person', 'caller'),
+    _Intent.OPERATOR: ('assigned', 'operator', 'technician', 'working', 'handling'),
+    _Intent.INCIDENT_ID: ('i-',),
+    _Intent.STATUS: ('open', 'closed', 'resolved', 'pending', 'new', 'active'),
+    _Intent.PRIORITY: ('critical', 'urgent', 'high', 'medium', 'low'),
+    _Intent.CATEGORY: ('change', 'rfc', 'wijziging', 'verandering', 'category'),
+    _Intent.TIME: ('day', 'week', 'month'),
+}
+
+_EXCLUDED_PERSON_TERMS = frozenset({
+    'user', 'person', 'caller', 'someone', 'tickets', 'incidents',
+    'changes', 'problems', 'issues', 'requests', 'email', 'password',
+    'network', 'system', 'server', 'application', 'last week', 'yesterday',
+    'recent', 'open', 'closed', 'high', 'low', 'medium', 'critical',
+    'priority', 'urgent'
+})
+
+
+def _word_prefix_re(words: Sequence[str]) -> re.Pattern:
+    """Match any of the words at the start of a word in the query."""
+    return re.compile(r'\b(?:%s)' % '|'.join(map(re.escape, words)))
+
+
+# Keyword lists match at the start of a word, so inflected forms such as
+# "overviews" or "fully" still count while "caller" does not contain "all"
+_COMPLETE_RE = _word_prefix_re(('complete', 'full', 'overview', 'details', 'all'))
+_OPEN_RE = _word_prefix_re(('open', 'active', 'unresolved', 'pending'))
+_CLARIFY_NAME_RE = _word_prefix_re(('sander', 'john', 'jane'))
+
+# Hints for _is_search_query
+_SEARCH_VERB_RE = _word_prefix_re(('find', 'search', 'look for'))
+_FIQL_HINT_RE = _word_prefix_re(('status', 'priority', 'assigned', 'operator', 'for', 'to'))
+_SEARCH_TECH_RE = _word_prefix_re((
+    'email', 'password', 'network', 'server', 'application', 'system',
+    'login', 'access', 'error', 'problem', 'issue', 'bug', 'crash'
+))
+
+# Plain int values indexed by regex group number, OR-ed before wrapping
+_INTENT_GROUP_BITS = (0,) + tuple(int(intent) for intent in _INTENT_KEYWORDS)
+
+# One capture group per intent inside a lookahead, so every position is
+# tried and the matching group's index identifies the intent.
+_KEYWORD_RE = re.compile(
+    '(?=%s)' % '|'.join(
+        '(%s)' % '|'.join(map(re.escape, keywords))
+        for keywords in _INTENT_KEYWORDS.values()
+    )
+)
+
+
+class _QueryIntents(NamedTuple):
+    """Intents detected in a normalized query."""
+    
+    overview_requested: bool
+    person_match: Optional[str]
+    operator_match: Optional[str]
+    incident_id: Optional[str]
+    status_filter: Optional[str]
+    priority_filter: Optional[Tuple[str, ...]]
+    category_filter: Optional[str]
+    time_filter: Optional[int]
+    word_count: int
+    search_query: bool
+
+
+def load_warmup_queries(path: str) -> List[str]:
+    """Read warm-up queries from a file with one query per line.
+    
+    Blank lines and lines starting with '#' are skipped.
+    
+    Args:
+        path: Path to the query file
+        
+    Returns:
+        Queries in file order, or an empty list if the file cannot be read
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    except OSError as e:
+        logger.warning(f"Could not read planner warm-up file {path}: {e}")
+        return []
+    
+    return [line.strip() for line in lines if line.strip() and not line.lstrip().startswith('#')]
+
+
 class QueryPlanner:
     """Plans execution for natural language queries."""
     
     def __init__(self):
-        # Common patterns for intent detection
-        self.person_patterns = [
-            r'\b(?:tickets?|incidents?|issues?)\s+(?:of|from|by|for)\s+([A-Za-z][A-Za-z\s]+[A-Za-z])',
-            r'\b([A-Za-z][A-Za-z\s]+[A-Za-z])\'s?\s+(?:tickets?|incidents?|issues?)',
-            r'\b(?:user|person|caller)\s+([A-Za-z][A-Za-z\s]+[A-Za-z])',
-        ]
-        
-        self.operator_patterns = [
-            r'\b(?:assigned\s+to|operator|technician)\s+([A-Za-z\s]+)',
-            r'\b([A-Za-z\s]+)\s+(?:is\s+)?(?:working\s+on|handling)',
-        ]
-        
-        self.status_patterns = [
-            r'\b(open|closed|resolved|pending|new)\s+(?:tickets?|incidents?)',
-            r'\b(?:tickets?|incidents?)\s+(?:that\s+are\s+)?(open|closed|resolved|pending|new)',
-            r'\bstatus\s*[=:]\s*(open|closed|resolved|pending|new)'
-        ]
-        
-        self.priority_patterns = [
-            r'\b(high|low|medium|critical|urgent)\s+priority',
-            r'\bpriority\s*[=:]\s*(high|low|medium|critical|urgent)',
-            r'\b(critical|urgent|high|medium|low)\s+(?:tickets?|incidents?)'
-        ]
-        
-        self.category_patterns = [
-            r'\b(change|rfc|request\s+for\s+change|wijziging|verandering)s?\b',
-            r'\b(wijzigingen|veranderingen)s?\b',  # Dutch plurals
-            r'\bcategory\s*[=:]\s*([A-Za-z\s]+)',
-        ]
-        
-        self.incident_id_patterns = [
-            r'\b(I-\d{6}-\d{3})\b',  # TOPdesk incident format
-            r'\bincident\s+(I-\d{6}-\d{3})\b',
-            r'\bticket\s+(I-\d{6}-\d{3})\b'
-        ]
-        
-        self.time_patterns = [
-            r'\b(?:last|past|recent)\s+(\d+)\s+(days?|weeks?|months?)',
-            r'\b(\d+)\s+(days?|weeks?|months?)\s+ago',
-            r'\btoday\b',
-            r'\byesterday\b',
-            r'\bthis\s+(week|month)',
-            r'\blast\s+(week|month)'
-        ]
+        # Intent detection depends only on the query text, so repeated queries
+        # reuse it. Plans are rebuilt each time since their time filters are
+        # relative to now.
+        self._detect_intents = lru_cache(maxsize=512)(self._detect_intents_uncached)
     
     def plan_query(self, query: str, max_results: int = 5) -> QueryPlan:
         """Plan execution for a natural language query.
@@ -75,69 +204,142 @@ class QueryPlanner:
         Returns:
             QueryPlan with execution steps and tool calls
         """
+        # One clock reading shared by every time filter in this plan
+        return self._plan(query, max_results, datetime.now(timezone.utc))
+    
+    def plan_queries(self, queries: List[str], max_results: int = 5) -> List[QueryPlan]:
+        """Plan execution for several natural language queries at once.
+        
+        Args:
+            queries: Natural language queries
+            max_results: Maximum results to return per query
+            
+        Returns:
+            QueryPlans in the same order as the queries, sharing one time
+            reference so their time filters line up
+        """
+        now = datetime.now(timezone.utc)
+        return [self._plan(query, max_results, now) for query in queries]
+    
+    def warm_up(self, queries: Iterable[str]) -> int:
+        """Pre-populate the intent cache so the first requests skip detection.
+        
+        Args:
+            queries: Well-known natural language queries
+            
+        Returns:
+            Number of queries processed
+        """
+        count = 0
+        for query in queries:
+            self._detect_intents(query.lower().strip())
+            count += 1
+        return count
+    
+    def _plan(self, query: str, max_results: int, now: datetime) -> QueryPlan:
+        """Plan a single query against a given reference time."""
         query = query.lower().strip()
         logger.debug(f"Planning query: {query}")
         
-        # Detect various intents
-        person_match = self._extract_person_name(query)
-        operator_match = self._extract_operator_name(query)
-        incident_id = self._extract_incident_id(query)
-        status_filter = self._extract_status(query)
-        priority_filter = self._extract_priority(query)
-        category_filter = self._extract_category(query)
-        time_filter = self._extract_time_constraint(query)
+        (overview_requested, person_match, operator_match, incident_id, status_filter,
+         priority_filter, category_filter, time_filter, word_count,
+         search_query) = self._detect_intents(query)
         
         # Check for complete incident overview request
-        if incident_id and any(word in query for word in ['complete', 'full', 'overview', 'details', 'all']):
+        if incident_id and overview_requested:
             return self._plan_complete_incident(incident_id, query)
         
         # Check for person-specific queries
         if person_match:
-            return self._plan_person_query(person_match, status_filter, time_filter, max_results, query)
+            return self._plan_person_query(person_match, status_filter, time_filter, max_results, query, now)
         
         # Check for operator-specific queries
         if operator_match:
-            return self._plan_operator_query(operator_match, status_filter, time_filter, max_results, query)
+            return self._plan_operator_query(operator_match, status_filter, time_filter, max_results, query, now)
         
         # Check for category-specific queries (e.g., changes/RFCs)
         if category_filter:
-            return self._plan_category_query(category_filter, status_filter, priority_filter, time_filter, max_results, query)
+            return self._plan_category_query(category_filter, status_filter, priority_filter, time_filter, max_results, query, now)
         
         # Check for simple search queries
-        if self._is_search_query(query):
+        if search_query:
             return self._plan_search_query(query, time_filter, max_results)
         
         # Check for FIQL-appropriate queries
-        if any([status_filter, priority_filter, time_filter]) or len(query.split()) > 5:
-            return self._plan_fiql_query(query, status_filter, priority_filter, time_filter, max_results)
+        if any([status_filter, priority_filter, time_filter]) or word_count > 5:
+            return self._plan_fiql_query(query, status_filter, priority_filter, time_filter, max_results, now)
         
         # Ambiguous query - ask for clarification
         return self._plan_clarification(query)
     
+    def _detect_intents_uncached(self, query: str) -> _QueryIntents:
+        """Run the intent extractors a query needs.
+        
+        Extractors without keyword hits are skipped, as are those whose result
+        cannot matter once a higher-priority route in plan_query is decided.
+        """
+        hits = self._scan_keywords(query)
+        
+        incident_id = self._extract_incident_id(query) if hits & _Intent.INCIDENT_ID else None
+        if incident_id and _COMPLETE_RE.search(query):
+            # Complete incident overviews need nothing else from the query
+            return _QueryIntents(True, None, None, incident_id, None, None, None, None, 0, False)
+        
+        person_match = self._extract_person_name(query) if hits & _Intent.PERSON else None
+        operator_match = None
+        category_filter = None
+        priority_filter = None
+        if not person_match:
+            operator_match = self._extract_operator_name(query) if hits & _Intent.OPERATOR else None
+            if not operator_match:
+                # Person and operator plans do not filter on category or priority
+                category_filter = self._extract_category(query) if hits & _Intent.CATEGORY else None
+                priority_filter = self._extract_priority(query) if hits & _Intent.PRIORITY else None
+        
+        word_count = len(query.split())
+        search_query = (
+            not (person_match or operator_match or category_filter)
+            and self._is_search_query(query, word_count)
+        )
+        
+        return _QueryIntents(
+            overview_requested=False,
+            person_match=person_match,
+            operator_match=operator_match,
+            incident_id=incident_id,
+            status_filter=self._extract_status(query) if hits & _Intent.STATUS else None,
+            priority_filter=priority_filter,
+            category_filter=category_filter,
+            time_filter=self._extract_time_constraint(query) if hits & _Intent.TIME else None,
+            word_count=word_count,
+            search_query=search_query
+        )
+    
+    def _scan_keywords(self, query: str) -> _Intent:
+        """Collect the intents whose keywords occur in the lower-cased query."""
+        bits = 0
+        for match in _KEYWORD_RE.finditer(query):
+            bits |= _INTENT_GROUP_BITS[match.lastindex]
+        return _Intent(bits)
+    
     def _extract_person_name(self, query: str) -> Optional[str]:
-        """Extract person name from query."""
-        for pattern in self.person_patterns:
-            match = re.search(pattern, query, re.IGNORECASE)
+        """Extract person name from query, matching keywords in any case."""
+        for pattern in _PERSON_PATTERNS:
+            match = pattern.search(query)
             if match:
                 name = match.group(1).strip()
-                # Filter out common non-names and non-person terms
-                excluded_terms = [
-                    'user', 'person', 'caller', 'someone', 'tickets', 'incidents',
-                    'changes', 'problems', 'issues', 'requests', 'email', 'password',
-                    'network', 'system', 'server', 'application', 'last week', 'yesterday',
-                    'recent', 'open', 'closed', 'high', 'low', 'medium', 'critical',
-                    'priority', 'urgent'
-                ]
-                if name.lower() not in excluded_terms and len(name.split()) <= 3:
-                    # Check if it looks like a name (contains letters, reasonable length)
-                    if re.match(r'^[A-Za-z\s\-\'\.]+$', name) and 2 <= len(name) <= 50:
-                        return name
+                # Filter out common non-names and non-person terms. The
+                # capture group only admits letters and whitespace and starts
+                # and ends with a letter, so only the length needs checking.
+                if (name.lower() not in _EXCLUDED_PERSON_TERMS
+                        and len(name.split()) <= 3 and len(name) <= 50):
+                    return name
         return None
     
     def _extract_operator_name(self, query: str) -> Optional[str]:
-        """Extract operator name from query."""
-        for pattern in self.operator_patterns:
-            match = re.search(pattern, query, re.IGNORECASE)
+        """Extract operator name from query, matching keywords in any case."""
+        for pattern in _OPERATOR_PATTERNS:
+            match = pattern.search(query)
             if match:
                 name = match.group(1).strip()
                 if name.lower() not in ['operator', 'technician', 'support']:
@@ -146,18 +348,17 @@ class QueryPlanner:
     
     def _extract_incident_id(self, query: str) -> Optional[str]:
         """Extract incident ID from query."""
-        for pattern in self.incident_id_patterns:
-            match = re.search(pattern, query, re.IGNORECASE)
-            if match:
-                return match.group(1)
-        return None
+        if 'i-' not in query and 'I-' not in query:
+            return None
+        match = _INCIDENT_ID_RE.search(query)
+        return match.group(1) if match else None
     
     def _extract_status(self, query: str) -> Optional[str]:
-        """Extract status filter from query."""
-        for pattern in self.status_patterns:
-            match = re.search(pattern, query, re.IGNORECASE)
+        """Extract status filter from a lower-cased query."""
+        for pattern in _STATUS_PATTERNS:
+            match = pattern.search(query)
             if match:
-                status = match.group(1).lower()
+                status = match.group(1)
                 # Map common variations
                 if status in ['open', 'new', 'pending']:
                     return 'open'
@@ -166,35 +367,22 @@ class QueryPlanner:
                 return status
         
         # Default to open if query mentions open-related terms
-        if any(word in query for word in ['open', 'active', 'unresolved', 'pending']):
+        if _OPEN_RE.search(query):
             return 'open'
         
         return None
     
-    def _extract_priority(self, query: str) -> Optional[List[str]]:
-        """Extract priority filter from query."""
-        priorities = []
-        
-        for pattern in self.priority_patterns:
-            match = re.search(pattern, query, re.IGNORECASE)
-            if match:
-                priority = match.group(1).lower()
-                # Map to standard priority names
-                if priority in ['critical', 'urgent']:
-                    priorities.append('Critical')
-                elif priority == 'high':
-                    priorities.append('High')
-                elif priority == 'medium':
-                    priorities.append('Medium')  
-                elif priority == 'low':
-                    priorities.append('Low')
-        
-        return priorities if priorities else None
+    def _extract_priority(self, query: str) -> Optional[Tuple[str, ...]]:
+        """Extract priority filter from a lower-cased query."""
+        match = _PRIORITY_RE.search(query)
+        if not match:
+            return None
+        return _PRIORITY_FILTERS[match.group(1) or match.group(2)]
     
     def _extract_category(self, query: str) -> Optional[str]:
         """Extract category filter from query."""
-        for pattern in self.category_patterns:
-            match = re.search(pattern, query, re.IGNORECASE)
+        for pattern in _CATEGORY_PATTERNS:
+            match = pattern.search(query)
             if match:
                 category = match.group(1).lower()
                 if any(term in category for term in ['change', 'rfc', 'wijziging', 'verandering']):
@@ -202,54 +390,51 @@ class QueryPlanner:
         return None
     
     def _extract_time_constraint(self, query: str) -> Optional[int]:
-        """Extract time constraint in days from query."""
-        for pattern in self.time_patterns:
-            match = re.search(pattern, query, re.IGNORECASE)
-            if match:
-                if 'today' in match.group(0).lower():
-                    return 1
-                elif 'yesterday' in match.group(0).lower():
-                    return 2
-                elif 'this week' in match.group(0).lower():
-                    return 7
-                elif 'last week' in match.group(0).lower():
-                    return 14
-                elif 'this month' in match.group(0).lower():
-                    return 30
-                elif 'last month' in match.group(0).lower():
-                    return 60
-                else:
-                    try:
-                        number = int(match.group(1))
-                        unit = match.group(2).lower()
-                        if 'day' in unit:
-                            return number
-                        elif 'week' in unit:
-                            return number * 7
-                        elif 'month' in unit:
-                            return number * 30
-                    except (ValueError, IndexError):
-                        pass
-        
-        return None  # Default will be applied in query building
+        """Extract time constraint in days from a lower-cased query."""
+        match = _TIME_RE.search(query)
+        if not match:
+            return None  # Default will be applied in query building
+        
+        literal, relative, period, count, unit, ago_count, ago_unit = match.groups()
+        if literal:
+            return _TIME_LITERAL_DAYS[literal]
+        if relative:
+            return _TIME_LITERAL_DAYS[f"{relative} {period}"]
+        if count:
+            return int(count) * _TIME_UNIT_DAYS[unit]
+        return int(ago_count) * _TIME_UNIT_DAYS[ago_unit]
     
-    def _is_search_query(self, query: str) -> bool:
+    def _is_search_query(self, query: str, word_count: Optional[int] = None) -> bool:
         """Determine if query is better suited for search."""
-        # Simple heuristics for search vs FIQL
-        search_indicators = [
-            len(query.split()) <= 3,  # Short queries
-            any(word in query for word in ['find', 'search', 'look for']),
-            not any(op in query for op in ['status', 'priority', 'assigned', 'operator', 'for', 'to']),
+        # Simple heuristics for search vs FIQL, cheapest checks first
+        if word_count is None:
+            word_count = len(query.split())
+        return (
+            word_count <= 3  # Short queries
+            or _SEARCH_VERB_RE.search(query) is not None
+            or _FIQL_HINT_RE.search(query) is None
             # Technical terms that are better for search
-            any(term in query.lower() for term in [
-                'email', 'password', 'network', 'server', 'application', 'system',
-                'login', 'access', 'error', 'problem', 'issue', 'bug', 'crash'
-            ])
-        ]
-        return any(search_indicators)
+            or _SEARCH_TECH_RE.search(query) is not None
+        )
+    
+    def _incident_filters(self, status_filter: Optional[str], priority_filter: Optional[Sequence[str]],
+                          time_days: int, now: Optional[datetime] = None) -> str:
+        """Build the status, priority and creation date filters shared by planners."""
+        filters = []
+        if status_filter == 'open':
+            filters.append("status!=Closed")
+        
+        if priority_filter:
+            filters.append(in_list("priority.name", priority_filter))
+        
+        # Always add time filter for incident queries
+        filters.append(f"creationDate=ge={days_ago(time_days, now)}")
+        
+        return and_join(*filters)
     
     def _plan_person_query(self, person_name: str, status_filter: Optional[str], 
-                          time_filter: Optional[int], max_results: int, original_query: str) -> QueryPlan:
+                          time_filter: Optional[int], max_results: int, original_query: str,
+                          now: Optional[datetime] = None) -> QueryPlan:
         """Plan a person-specific query."""
         steps = []
         tool_calls = []
@@ -257,12 +442,7 @@ class QueryPlanner:
         
         # Step 1: Look up person
         name_parts = person_name.split()
-        if len(name_parts) >= 2:
-            first_name, last_name = name_parts[0], name_parts[-1]
-            person_fiql = build_person_query(first_name=first_name, last_name=last_name)
-        else:
-            # Try surname lookup first
-            person_fiql = build_person_query(last_name=person_name)
+        person_fiql = build_person_query_from_parts(name_parts)
         
         steps.append(PlanStep(
             step=1,
@@ -280,13 +460,7 @@ class QueryPlanner:
         time_days = time_filter or 30  # Default to 30 days
         
         # Build incident query (we'll use placeholder for caller_id)
-        incident_filters = []
-        if status_filter == 'open':
-            incident_filters.append("status!=Closed")
-        
-        incident_filters.append(f"creationDate=ge={days_ago(time_days)}")
-        
-        incident_query = and_join(*incident_filters)  # Will prepend caller.id later
+        incident_query = self._incident_filters(status_filter, None, time_days, now)
         
         steps.append(PlanStep(
             step=2,
@@ -315,7 +489,8 @@ class QueryPlanner:
         )
     
     def _plan_operator_query(self, operator_name: str, status_filter: Optional[str],
-                           time_filter: Optional[int], max_results: int, original_query: str) -> QueryPlan:
+                           time_filter: Optional[int], max_results: int, original_query: str,
+                           now: Optional[datetime] = None) -> QueryPlan:
         """Plan an operator-specific query."""
         steps = []
         tool_calls = []
@@ -339,13 +514,7 @@ class QueryPlanner:
         # Step 2: Get incidents for operator
         time_days = time_filter or 30
         
-        incident_filters = []
-        if status_filter == 'open':
-            incident_filters.append("status!=Closed")
-        
-        incident_filters.append(f"creationDate=ge={days_ago(time_days)}")
-        
-        incident_query = and_join(*incident_filters)
+        incident_query = self._incident_filters(status_filter, None, time_days, now)
         
         steps.append(PlanStep(
             step=2,
@@ -370,23 +539,16 @@ class QueryPlanner:
         )
     
     def _plan_category_query(self, category: str, status_filter: Optional[str],
-                           priority_filter: Optional[List[str]], time_filter: Optional[int],
-                           max_results: int, original_query: str) -> QueryPlan:
+                           priority_filter: Optional[Sequence[str]], time_filter: Optional[int],
+                           max_results: int, original_query: str,
+                           now: Optional[datetime] = None) -> QueryPlan:
         """Plan a category-specific query."""
         time_days = time_filter or 60  # Default to 60 days for changes
         
-        fiql_parts = [f"category.name=='{category}'"]
-        
-        if status_filter == 'open':
-            fiql_parts.append("status!=Closed")
-        
-        if priority_filter:
-            from .fiql import in_list
-            fiql_parts.append(in_list("priority.name", priority_filter))
-        
-        fiql_parts.append(f"creationDate=ge={days_ago(time_days)}")
-        
-        fiql_query = and_join(*fiql_parts)
+        fiql_query = and_join(
+            f"category.name=='{category}'",
+            self._incident_filters(status_filter, priority_filter, time_days, now)
+        )
         
         steps = [PlanStep(
             step=1,
@@ -441,24 +603,12 @@ class QueryPlanner:
         )
     
     def _plan_fiql_query(self, query: str, status_filter: Optional[str],
-                        priority_filter: Optional[List[str]], time_filter: Optional[int],
-                        max_results: int) -> QueryPlan:
+                        priority_filter: Optional[Sequence[str]], time_filter: Optional[int],
+                        max_results: int, now: Optional[datetime] = None) -> QueryPlan:
         """Plan a FIQL-based query for complex filtering."""
         time_days = time_filter or 30
         
-        fiql_parts = []
-        
-        if status_filter == 'open':
-            fiql_parts.append("status!=Closed")
-        
-        if priority_filter:
-            from .fiql import in_list
-            fiql_parts.append(in_list("priority.name", priority_filter))
-        
-        # Always add time filter for FIQL queries
-        fiql_parts.append(f"creationDate=ge={days_ago(time_days)}")
-        
-        fiql_query = and_join(*fiql_parts)
+        fiql_query = self._incident_filters(status_filter, priority_filter, time_days, now)
         
         steps = [PlanStep(
             step=1,
@@ -516,10 +666,10 @@ class QueryPlanner:
         clarification_msg = "Your query is ambiguous. Please specify:\n"
         
         # Check what might be unclear
-        if any(name in query.lower() for name in ['sander', 'john', 'jane']):
+        if _CLARIFY_NAME_RE.search(query):
             clarification_msg += "- The full name of the person you're asking about\n"
         
-        if 'ticket' in query.lower() or 'incident' in query.lower():
+        if 'ticket' in query or 'incident' in query:
             clarification_msg += "- Whether you want open/closed incidents\n"
             clarification_msg += "- The time period you're interested in\n"
         
@@ -2,8 +2,11 @@
 
 import asyncio
 import logging
+import re
 import time
-from typing import Dict, Any, List, Optional
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple
 
 from .schemas import QueryRequest, QueryResponse, QueryPlan, ToolCall, NormalizedIncident
 from .planning import QueryPlanner
@@ -23,12 +26,78 @@ from .fiql import and_join
 
 logger = logging.getLogger(__name__)
 
+# Id placeholders left in FIQL queries by the planner, and the kind of
+# earlier lookup that supplies each id
+_PLACEHOLDER_RE = re.compile(r"(?P<field>caller|operator)\.id==PLACEHOLDER")
+_PLACEHOLDER_SOURCES = {"caller": "person", "operator": "operator"}
+
+# Kind of normalized result each tool's response holds
+_RESPONSE_KINDS = {
+    "topdesk_get_person_by_query": "person",
+    "topdesk_get_operators_by_fiql_query": "operator",
+    "topdesk_get_incidents_by_fiql_query": "incidents",
+    "search": "incidents",
+    "topdesk_get_complete_incident_overview": "incident",
+}
+
+
+@dataclass(slots=True)
+class ToolResult:
+    """Outcome of one executed tool call."""
+    step: int  # 1-based position in the plan
+    tool_call: ToolCall  # As executed, with placeholders resolved
+    response: Any = None
+    error: Optional[str] = None
+    kind: Optional[str] = None  # "person", "operator" or "incidents" once normalized
+    normalized: Any = None
+    
+    @property
+    def key(self) -> str:
+        """Key of this result in the public raw response map."""
+        return f"step_{self.step}_{self.tool_call.name}"
+    
+    @classmethod
+    def from_response(cls, step: int, tool_call: ToolCall, response: Any) -> "ToolResult":
+        """Record a tool response, normalizing it according to its tool.
+        
+        Args:
+            step: 1-based position in the plan
+            tool_call: Executed tool call
+            response: Raw MCP response
+            
+        Returns:
+            ToolResult with kind and normalized set when the response holds
+            a person, an operator or incidents
+        """
+        result = cls(step=step, tool_call=tool_call, response=response)
+        if isinstance(response, dict) and response.get("error"):
+            return result
+        
+        kind = _RESPONSE_KINDS.get(tool_call.name)
+        if kind == "person":
+            result.normalized = normalize_person_response(response)
+        elif kind == "operator":
+            result.normalized = normalize_operator_response(response)
+        elif kind == "incident":
+            # Single incident from complete overview
+            if isinstance(response, dict) and "id" in response:
+                kind = "incidents"
+                result.normalized = normalize_incidents_response([response])
+        elif kind == "incidents":
+            result.normalized = normalize_incidents_response(response)
+        
+        if result.normalized:
+            result.kind = kind
+        return result
+
 
 class QueryRouter:
     """Routes natural language queries to appropriate MCP tools."""
     
-    def __init__(self):
+    def __init__(self, mcp_client: Optional[TopdeskMCPClient] = None):
         self.planner = QueryPlanner()
+        # Long-lived client shared across queries; set by the app lifespan
+        self.mcp_client = mcp_client
     
     async def process_query(self, request: QueryRequest, client_ip: str) -> QueryResponse:
         """Process a natural language query end-to-end.
@@ -40,7 +109,7 @@ class QueryRouter:
         Returns:
             Complete query response
         """
-        start_time = time.time()
+        start_time = time.monotonic()
         warnings = []
         
         try:
@@ -49,21 +118,26 @@ class QueryRouter:
             
             # If clarification needed, return early
             if plan.clarify:
-                return QueryResponse(
+                return QueryResponse.model_construct(
                     plan=plan,
                     tool_calls=[],
                     raw={},
                     results=[],
                     summary=plan.clarify,
-                    execution_time=time.time() - start_time,
+                    execution_time=time.monotonic() - start_time,
                     warnings=[]
                 )
             
             # Execute the plan
-            raw_responses, executed_tools = await self._execute_plan(plan)
+            results = await self._execute_plan(plan)
+            executed_tools = [result.tool_call for result in results if result.error is None]
+            raw_responses = {
+                result.key: {"error": result.error} if result.error is not None else result.response
+                for result in results
+            }
             
             # Normalize results
-            incidents, extra_info = await self._normalize_results(plan, raw_responses)
+            incidents, extra_info = await self._normalize_results(plan, results)
             
             # Generate summary
             summary = await self._generate_summary(plan, incidents, extra_info, request.query)
@@ -71,7 +145,7 @@ class QueryRouter:
             # Collect all warnings
             all_warnings = plan.warnings + warnings
             
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
             
             # Log successful query (sanitized)
             logger.info(f"Query processed successfully", extra={
@@ -82,7 +156,8 @@ class QueryRouter:
                 "client_ip": client_ip[:8] + "***"  # Partial IP for privacy
             })
             
-            return QueryResponse(
+            # Every field comes from trusted internal code, so skip revalidation
+            return QueryResponse.model_construct(
                 plan=plan,
                 tool_calls=executed_tools,
                 raw=sanitize_for_logging(raw_responses),
@@ -93,7 +168,7 @@ class QueryRouter:
             )
         
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
             error_summary = generate_error_summary(str(e), request.query)
             
             logger.error(f"Query processing failed", extra={
@@ -114,104 +189,149 @@ class QueryRouter:
                 warnings=[f"Error: {str(e)}"]
             )
     
-    async def _execute_plan(self, plan: QueryPlan) -> tuple[Dict[str, Any], List[ToolCall]]:
+    @asynccontextmanager
+    async def _client_session(self) -> AsyncIterator[TopdeskMCPClient]:
+        """Yield the shared MCP client, or a short-lived one if none is set."""
+        if self.mcp_client is not None:
+            yield self.mcp_client
+            return
+        
+        async with TopdeskMCPClient() as client:
+            yield client
+    
+    async def _execute_plan(self, plan: QueryPlan) -> List[ToolResult]:
         """Execute the planned tool calls.
         
         Args:
             plan: Query execution plan
             
         Returns:
-            Tuple of (raw_responses, executed_tools)
+            One ToolResult per tool call, in plan order
         """
-        raw_responses = {}
-        executed_tools = []
+        tool_results = []
         
-        async with TopdeskMCPClient() as client:
-            for i, tool_call in enumerate(plan.tool_calls):
-                try:
-                    logger.debug(f"Executing tool {tool_call.name} with payload: {sanitize_for_logging(tool_call.payload)}")
-                    
-                    # Handle multi-step queries that depend on previous results
-                    if "PLACEHOLDER" in str(tool_call.payload):
-                        tool_call = await self._resolve_placeholder(tool_call, raw_responses)
+        async with self._client_session() as client:
+            # Calls within a wave are independent and run concurrently; a wave
+            # starts at each call that depends on earlier results
+            for wave in self._partition_waves(plan.tool_calls):
+                results = await asyncio.gather(
+                    *(self._run_tool_call(client, tool_call, tool_results) for _, tool_call in wave),
+                    return_exceptions=True
+                )
+                
+                for (i, tool_call), result in zip(wave, results):
+                    if isinstance(result, Exception):
+                        logger.error(f"Tool {tool_call.name} failed: {result}")
+                        tool_results.append(ToolResult(step=i + 1, tool_call=tool_call, error=str(result)))
+                        # Continue with other tools even if one fails
+                        continue
+                    if isinstance(result, BaseException):
+                        raise result
                     
-                    response = await client.call_tool(tool_call.name, tool_call.payload)
-                    raw_responses[f"step_{i+1}_{tool_call.name}"] = response
-                    executed_tools.append(tool_call)
+                    # Normalized once here; later waves and result collection reuse it
+                    executed_tool, response = result
+                    tool_results.append(ToolResult.from_response(i + 1, executed_tool, response))
                     
                     logger.debug(f"Tool {tool_call.name} completed successfully")
-                
-                except Exception as e:
-                    logger.error(f"Tool {tool_call.name} failed: {e}")
-                    raw_responses[f"step_{i+1}_{tool_call.name}"] = {"error": str(e)}
-                    # Continue with other tools even if one fails
         
-        return raw_responses, executed_tools
+        return tool_results
     
-    async def _resolve_placeholder(self, tool_call: ToolCall, previous_responses: Dict[str, Any]) -> ToolCall:
+    @staticmethod
+    def _partition_waves(tool_calls: List[ToolCall]) -> List[List[Tuple[int, ToolCall]]]:
+        """Split tool calls into waves that can each be executed concurrently.
+        
+        Args:
+            tool_calls: Planned tool calls in execution order
+            
+        Returns:
+            Lists of (index, tool_call) pairs; every call containing a
+            placeholder starts a new wave after the calls it depends on
+        """
+        waves = []
+        current = []
+        for i, tool_call in enumerate(tool_calls):
+            if current and "PLACEHOLDER" in str(tool_call.payload):
+                waves.append(current)
+                current = []
+            current.append((i, tool_call))
+        
+        if current:
+            waves.append(current)
+        return waves
+    
+    async def _run_tool_call(self, client: TopdeskMCPClient, tool_call: ToolCall,
+                             previous_results: List[ToolResult]) -> Tuple[ToolCall, Any]:
+        """Resolve placeholders in a tool call and execute it.
+        
+        Args:
+            client: Open MCP client
+            tool_call: Tool call to execute
+            previous_results: Results from earlier waves
+            
+        Returns:
+            Tuple of (executed_tool_call, response)
+        """
+        # Only pay for sanitizing the payload when it will be logged
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Executing tool {tool_call.name} with payload: {sanitize_for_logging(tool_call.payload)}")
+        
+        # Handle multi-step queries that depend on previous results
+        if "PLACEHOLDER" in str(tool_call.payload):
+            tool_call = await self._resolve_placeholder(tool_call, previous_results)
+        
+        response = await client.call_tool(tool_call.name, tool_call.payload)
+        return tool_call, response
+    
+    async def _resolve_placeholder(self, tool_call: ToolCall,
+                                   previous_results: List[ToolResult]) -> ToolCall:
         """Resolve placeholder values in tool calls based on previous responses.
         
         Args:
             tool_call: Tool call with potential placeholders
-            previous_responses: Results from previous tool calls
+            previous_results: Results from previous tool calls
             
         Returns:
             Tool call with placeholders resolved
         """
-        payload = tool_call.payload.copy()
+        ids = {}
         
-        # Look for FIQL query with caller.id==PLACEHOLDER
-        if "fiql_query" in payload and "caller.id==PLACEHOLDER" in payload["fiql_query"]:
-            # Find person ID from previous person lookup
-            person_id = None
-            for response_key, response in previous_responses.items():
-                if "person" in response_key:
-                    person_info = normalize_person_response(response)
-                    if person_info and person_info.get("id"):
-                        person_id = person_info["id"]
-                        break
-            
-            if person_id:
-                # Replace placeholder with actual person ID
-                fiql_query = payload["fiql_query"]
-                fiql_query = fiql_query.replace("caller.id==PLACEHOLDER", f"caller.id=='{person_id}'")
-                payload["fiql_query"] = fiql_query
-            else:
-                # No person ID found, use impossible condition to return no results
-                fiql_query = payload["fiql_query"]
-                fiql_query = fiql_query.replace("caller.id==PLACEHOLDER", "caller.id=='NOTFOUND'")
-                payload["fiql_query"] = fiql_query
+        def replace(match: re.Match) -> str:
+            field = match["field"]
+            if field not in ids:
+                ids[field] = self._find_id(_PLACEHOLDER_SOURCES[field], previous_results)
+            # Without an id, use an impossible condition to return no results
+            return f"{field}.id=='{ids[field] or 'NOTFOUND'}'"
         
-        # Look for operator.id==PLACEHOLDER
-        elif "fiql_query" in payload and "operator.id==PLACEHOLDER" in payload["fiql_query"]:
-            # Find operator ID from previous operator lookup
-            operator_id = None
-            for response_key, response in previous_responses.items():
-                if "operator" in response_key:
-                    operator_info = normalize_operator_response(response)
-                    if operator_info and operator_info.get("id"):
-                        operator_id = operator_info["id"]
-                        break
-            
-            if operator_id:
-                # Replace placeholder with actual operator ID
-                fiql_query = payload["fiql_query"]
-                fiql_query = fiql_query.replace("operator.id==PLACEHOLDER", f"operator.id=='{operator_id}'")
-                payload["fiql_query"] = fiql_query
-            else:
-                # No operator ID found, use impossible condition
-                fiql_query = payload["fiql_query"]
-                fiql_query = fiql_query.replace("operator.id==PLACEHOLDER", "operator.id=='NOTFOUND'")
-                payload["fiql_query"] = fiql_query
+        payload = {
+            key: _PLACEHOLDER_RE.sub(replace, value) if isinstance(value, str) else value
+            for key, value in tool_call.payload.items()
+        }
         
         return ToolCall(name=tool_call.name, payload=payload)
     
-    async def _normalize_results(self, plan: QueryPlan, raw_responses: Dict[str, Any]) -> tuple[List[NormalizedIncident], Dict[str, Any]]:
-        """Normalize raw MCP responses to structured results.
+    @staticmethod
+    def _find_id(kind: str, results: List[ToolResult]) -> Optional[str]:
+        """Return the id of the first normalized person or operator of a kind.
+        
+        Args:
+            kind: "person" or "operator"
+            results: Results of earlier tool calls
+            
+        Returns:
+            The id, or None if no earlier lookup found one
+        """
+        for result in results:
+            if result.kind == kind and result.normalized.get("id"):
+                return result.normalized["id"]
+        return None
+    
+    async def _normalize_results(self, plan: QueryPlan, results: List[ToolResult]
+                                 ) -> tuple[List[NormalizedIncident], Dict[str, Any]]:
+        """Collect normalized results from executed tool calls.
         
         Args:
             plan: Original query plan
-            raw_responses: Raw responses from MCP tools
+            results: Results from _execute_plan
             
         Returns:
             Tuple of (normalized_incidents, extra_info)
@@ -219,29 +339,12 @@ class QueryRouter:
         incidents = []
         extra_info = {}
         
-        # Extract person/operator info if available
-        for response_key, response in raw_responses.items():
-            if "person" in response_key and not response.get("error"):
-                person_info = normalize_person_response(response)
-                if person_info:
-                    extra_info["person"] = person_info
-            
-            elif "operator" in response_key and not response.get("error"):
-                operator_info = normalize_operator_response(response)
-                if operator_info:
-                    extra_info["operator"] = operator_info
-            
-            elif any(tool in response_key for tool in ["incidents", "search", "complete"]) and not response.get("error"):
-                # This response contains incidents
-                if "complete_incident_overview" in response_key:
-                    # Single incident from complete overview
-                    if isinstance(response, dict) and "id" in response:
-                        normalized = normalize_incidents_response([response])
-                        incidents.extend(normalized)
-                else:
-                    # Multiple incidents
-                    normalized = normalize_incidents_response(response)
-                    incidents.extend(normalized)
+        for result in results:
+            if result.kind == "incidents":
+                incidents.extend(result.normalized)
+            elif result.kind is not None:
+                # Person or operator info
+                extra_info[result.kind] = result.normalized
         
         return incidents, extra_info
     
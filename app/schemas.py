@@ -1,7 +1,8 @@
 """Pydantic schemas for request/response validation."""
 
-from pydantic import BaseModel, Field, validator
-from typing import List, Dict, Any, Optional
+from dataclasses import dataclass, field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import Annotated, List, Dict, Any, Optional
 from datetime import datetime
 
 
@@ -11,7 +12,8 @@ class QueryRequest(BaseModel):
     query: str = Field(..., min_length=1, max_length=1000, description="Natural language query")
     max_results: int = Field(5, ge=1, le=25, description="Maximum number of results to return")
     
-    @validator('query')
+    @field_validator('query')
+    @classmethod
     def validate_query(cls, v):
         """Validate query is not empty after stripping."""
         if not v.strip():
@@ -19,30 +21,36 @@ class QueryRequest(BaseModel):
         return v.strip()
 
 
-class ToolCall(BaseModel):
+# Planner output is built on every query, so these are slotted dataclasses
+# rather than models; pydantic still validates and documents them where they
+# are embedded in QueryResponse.
+@dataclass(slots=True, kw_only=True)
+class ToolCall:
     """Schema for MCP tool calls."""
     
-    name: str = Field(..., description="Name of the MCP tool")
-    payload: Dict[str, Any] = Field(..., description="Payload for the tool call")
+    name: Annotated[str, Field(description="Name of the MCP tool")]
+    payload: Annotated[Dict[str, Any], Field(description="Payload for the tool call")]
 
 
-class PlanStep(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class PlanStep:
     """Schema for individual plan steps."""
     
-    step: int = Field(..., description="Step number")
-    action: str = Field(..., description="Description of the action")
-    tool_name: Optional[str] = Field(None, description="MCP tool to be called")
-    reasoning: str = Field(..., description="Reasoning for this step")
+    step: Annotated[int, Field(description="Step number")]
+    action: Annotated[str, Field(description="Description of the action")]
+    tool_name: Annotated[Optional[str], Field(description="MCP tool to be called")] = None
+    reasoning: Annotated[str, Field(description="Reasoning for this step")]
 
 
-class QueryPlan(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class QueryPlan:
     """Schema for query execution plan."""
     
-    intent: str = Field(..., description="Detected intent from the query")
-    steps: List[PlanStep] = Field(..., description="Planned execution steps")
-    tool_calls: List[ToolCall] = Field(..., description="Tool calls to be executed")
-    clarify: Optional[str] = Field(None, description="Clarification needed from user")
-    warnings: List[str] = Field(default_factory=list, description="Warnings about the plan")
+    intent: Annotated[str, Field(description="Detected intent from the query")]
+    steps: Annotated[List[PlanStep], Field(description="Planned execution steps")]
+    tool_calls: Annotated[List[ToolCall], Field(description="Tool calls to be executed")]
+    clarify: Annotated[Optional[str], Field(description="Clarification needed from user")] = None
+    warnings: Annotated[List[str], Field(description="Warnings about the plan")] = field(default_factory=list)
 
 
 class NormalizedIncident(BaseModel):
@@ -74,6 +82,8 @@ class QueryResponse(BaseModel):
 class ErrorResponse(BaseModel):
     """Error response schema."""
     
+    model_config = ConfigDict(frozen=True)
+    
     error: str = Field(..., description="Error message")
     code: int = Field(..., description="Error code")
     details: Optional[Dict[str, Any]] = Field(None, description="Additional error details")
@@ -82,7 +92,18 @@ class ErrorResponse(BaseModel):
 class HealthResponse(BaseModel):
     """Health check response schema."""
     
+    model_config = ConfigDict(frozen=True)
+    
     status: str = Field(..., description="Service status")
     mcp_connection: str = Field(..., description="MCP server connection status")
     timestamp: datetime = Field(default_factory=datetime.utcnow, description="Check timestamp")
-    version: str = Field(..., description="Service version")
\ No newline at end of file
+    version: str = Field(..., description="Service version")
+
+
+class ServiceInfoResponse(BaseModel):
+    """Root endpoint response schema."""
+    
+    service: str = Field(..., description="Service name")
+    version: str = Field(..., description="Service version")
+    description: str = Field(..., description="Service description")
+    endpoints: Dict[str, str] = Field(..., description="Main endpoints by purpose")
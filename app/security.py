@@ -2,8 +2,8 @@
 
 import asyncio
 import time
-from collections import defaultdict, deque
-from typing import Dict, Optional
+from collections import OrderedDict, defaultdict, deque
+from typing import Optional, Tuple
 from enum import Enum
 from dataclasses import dataclass
 from .config import settings
@@ -16,12 +16,12 @@ class CircuitState(Enum):
     HALF_OPEN = "half_open"  # Testing if service is back up
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenBucket:
     """Token bucket for rate limiting."""
     capacity: int
     tokens: float
-    last_refill: float
+    last_refill: float  # time.monotonic() reading
     refill_rate: float  # tokens per second
     
     def consume(self, tokens: int = 1) -> bool:
@@ -33,7 +33,7 @@ class TokenBucket:
         Returns:
             True if tokens were consumed, False if not available
         """
-        now = time.time()
+        now = time.monotonic()
         
         # Refill tokens based on time elapsed
         time_passed = now - self.last_refill
@@ -47,12 +47,19 @@ class TokenBucket:
         return False
 
 
+# Upper bound on tracked clients, so floods of distinct IPs cannot grow
+# the rate limiter without limit
+_MAX_BUCKETS = 100_000
+
+
 class RateLimiter:
     """Token bucket based rate limiter."""
     
     def __init__(self):
-        self._buckets: Dict[str, TokenBucket] = {}
-        self._lock = asyncio.Lock()
+        # No lock: bucket updates never await, so on the single-threaded
+        # event loop each check runs to completion without interleaving.
+        # Buckets are kept in least recently used order.
+        self._buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
     
     async def is_allowed(self, key: str, tokens: int = 1) -> bool:
         """Check if request is allowed under rate limit.
@@ -64,18 +71,36 @@ class RateLimiter:
         Returns:
             True if request is allowed, False if rate limited
         """
-        async with self._lock:
-            if key not in self._buckets:
-                # Create new bucket for this key
-                refill_rate = settings.rate_limit_requests / settings.rate_limit_window
-                self._buckets[key] = TokenBucket(
-                    capacity=settings.rate_limit_requests,
-                    tokens=settings.rate_limit_requests,
-                    last_refill=time.time(),
-                    refill_rate=refill_rate
-                )
+        allowed, _ = await self.is_allowed_with_remaining(key, tokens)
+        return allowed
+    
+    async def is_allowed_with_remaining(self, key: str, tokens: int = 1) -> Tuple[bool, int]:
+        """Consume tokens and report the remaining budget in one step.
+        
+        Args:
+            key: Identifier for the rate limit (e.g., IP address)
+            tokens: Number of tokens to consume
             
-            return self._buckets[key].consume(tokens)
+        Returns:
+            Tuple of (allowed, remaining requests)
+        """
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            self._evict_idle(time.monotonic())
+            
+            # Create new bucket for this key
+            refill_rate = settings.rate_limit_requests / settings.rate_limit_window
+            bucket = self._buckets[key] = TokenBucket(
+                capacity=settings.rate_limit_requests,
+                tokens=settings.rate_limit_requests,
+                last_refill=time.monotonic(),
+                refill_rate=refill_rate
+            )
+        else:
+            self._buckets.move_to_end(key)
+        
+        allowed = bucket.consume(tokens)
+        return allowed, int(bucket.tokens)
     
     async def get_remaining(self, key: str) -> int:
         """Get remaining requests for a key.
@@ -86,28 +111,40 @@ class RateLimiter:
         Returns:
             Number of remaining requests
         """
-        async with self._lock:
-            if key not in self._buckets:
-                return settings.rate_limit_requests
-            
-            bucket = self._buckets[key]
-            # Update tokens first
-            now = time.time()
-            time_passed = now - bucket.last_refill
-            bucket.tokens = min(bucket.capacity, bucket.tokens + time_passed * bucket.refill_rate)
-            bucket.last_refill = now
-            
-            return int(bucket.tokens)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            return settings.rate_limit_requests
+        
+        # Read-only refill projection; the bucket itself is only updated
+        # when tokens are consumed, which also keeps its LRU position
+        time_passed = time.monotonic() - bucket.last_refill
+        return int(min(bucket.capacity, bucket.tokens + time_passed * bucket.refill_rate))
+    
+    def _evict_idle(self, now: float) -> None:
+        """Drop idle buckets, and the least recently used ones beyond the size cap.
+        
+        A bucket idle for a whole rate limit window has refilled completely,
+        so dropping it is indistinguishable from keeping it.
+        
+        Args:
+            now: Current time.monotonic() reading
+        """
+        buckets = self._buckets
+        while buckets:
+            oldest = next(iter(buckets.values()))
+            if len(buckets) < _MAX_BUCKETS and now - oldest.last_refill < settings.rate_limit_window:
+                break
+            buckets.popitem(last=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class CircuitBreakerState:
     """Circuit breaker state tracking."""
     state: CircuitState = CircuitState.CLOSED
     failure_count: int = 0
-    last_failure_time: float = 0
-    last_success_time: float = 0
-    next_attempt_time: float = 0
+    last_failure_time: float = 0  # Wall-clock, for reporting
+    last_success_time: float = 0  # Wall-clock, for reporting
+    next_attempt_time: float = 0  # time.monotonic() deadline
 
 
 class CircuitBreaker:
@@ -124,9 +161,14 @@ class CircuitBreaker:
         Returns:
             True if request is allowed, False if circuit is open
         """
+        # Fast path: the dominant closed state is a single read, no lock needed
+        if self._state.state is CircuitState.CLOSED:
+            return True
+        
         async with self._lock:
-            now = time.time()
+            now = time.monotonic()
             
+            # Re-check under the lock; the state may have changed meanwhile
             if self._state.state == CircuitState.CLOSED:
                 return True
             elif self._state.state == CircuitState.OPEN:
@@ -140,6 +182,11 @@ class CircuitBreaker:
     
     async def record_success(self):
         """Record a successful request."""
+        # Fast path: a healthy closed circuit only needs its timestamp updated
+        if self._state.state is CircuitState.CLOSED and self._state.failure_count == 0:
+            self._state.last_success_time = time.time()
+            return
+        
         async with self._lock:
             self._state.failure_count = 0
             self._state.last_success_time = time.time()
@@ -155,7 +202,7 @@ class CircuitBreaker:
             if self._state.failure_count >= settings.circuit_breaker_failure_threshold:
                 self._state.state = CircuitState.OPEN
                 self._state.next_attempt_time = (
-                    time.time() + settings.circuit_breaker_recovery_timeout
+                    time.monotonic() + settings.circuit_breaker_recovery_timeout
                 )
     
     async def get_state(self) -> dict:
@@ -165,13 +212,18 @@ class CircuitBreaker:
             Dictionary with current state information
         """
         async with self._lock:
+            next_attempt_time = None
+            if self._state.state == CircuitState.OPEN:
+                # Report the monotonic deadline as a wall-clock timestamp
+                next_attempt_time = time.time() + (self._state.next_attempt_time - time.monotonic())
+            
             return {
                 "service": self.service_name,
                 "state": self._state.state.value,
                 "failure_count": self._state.failure_count,
                 "last_failure_time": self._state.last_failure_time,
                 "last_success_time": self._state.last_success_time,
-                "next_attempt_time": self._state.next_attempt_time if self._state.state == CircuitState.OPEN else None
+                "next_attempt_time": next_attempt_time
             }
 
 
@@ -193,6 +245,17 @@ class SecurityManager:
         """
         return await self.rate_limiter.is_allowed(client_ip)
     
+    async def check_rate_limit_and_remaining(self, client_ip: str) -> Tuple[bool, int]:
+        """Check rate limits and get the remaining requests in one call.
+        
+        Args:
+            client_ip: Client IP address
+            
+        Returns:
+            Tuple of (allowed, remaining requests)
+        """
+        return await self.rate_limiter.is_allowed_with_remaining(client_ip)
+    
     async def get_rate_limit_remaining(self, client_ip: str) -> int:
         """Get remaining requests for client.
         
@@ -254,8 +317,8 @@ def get_client_ip(request) -> str:
     # Check for forwarded headers (when behind proxy)
     forwarded_for = request.headers.get("X-Forwarded-For")
     if forwarded_for:
-        # Take the first IP in the chain
-        return forwarded_for.split(",")[0].strip()
+        # Take the first IP in the chain without splitting every hop
+        return forwarded_for.partition(",")[0].strip()
     
     real_ip = request.headers.get("X-Real-IP")
     if real_ip:
@@ -1,13 +1,21 @@
 """Result summarization utilities."""
 
 import logging
-from typing import List, Dict, Any, Optional
-from collections import Counter
+import heapq
+from typing import List, Dict, Any, Mapping, Optional
+from operator import itemgetter
 from .schemas import NormalizedIncident
 
 
 logger = logging.getLogger(__name__)
 
+# Query words that mark a summary as covering recent incidents
+_RECENT_WORDS = ("recent", "last", "today", "yesterday")
+
+# Query words that tell which kind of lookup a "not found" error refers to
+_PERSON_WORDS = ("person", "user", "caller")
+_OPERATOR_WORDS = ("operator", "technician")
+
 
 def summarize_incidents(incidents: List[NormalizedIncident], original_query: str = "") -> str:
     """Generate a natural language summary of incident results.
@@ -23,12 +31,27 @@ def summarize_incidents(incidents: List[NormalizedIncident], original_query: str
         return "No incidents found matching your query."
     
     count = len(incidents)
-    
-    # Analyze the data
-    status_counts = Counter(inc.status for inc in incidents if inc.status)
-    priority_counts = Counter(inc.priority for inc in incidents if inc.priority)
-    operator_counts = Counter(inc.operator for inc in incidents if inc.operator)
-    caller_counts = Counter(inc.caller for inc in incidents if inc.caller)
+    query_lower = original_query.lower()
+    
+    # Analyze the data in one pass; plain dicts count faster than Counter's
+    # += on a missing key
+    status_counts: Dict[str, int] = {}
+    priority_counts: Dict[str, int] = {}
+    operator_counts: Dict[str, int] = {}
+    caller_counts: Dict[str, int] = {}
+    for inc in incidents:
+        value = inc.status
+        if value:
+            status_counts[value] = status_counts.get(value, 0) + 1
+        value = inc.priority
+        if value:
+            priority_counts[value] = priority_counts.get(value, 0) + 1
+        value = inc.operator
+        if value:
+            operator_counts[value] = operator_counts.get(value, 0) + 1
+        value = inc.caller
+        if value:
+            caller_counts[value] = caller_counts.get(value, 0) + 1
     
     # Start building summary
     summary_parts = []
@@ -68,34 +91,26 @@ def summarize_incidents(incidents: List[NormalizedIncident], original_query: str
         
         # Mention top operator if significant
         if operator_counts:
-            top_operator, top_count = operator_counts.most_common(1)[0]
+            top_operator, top_count = max(operator_counts.items(), key=itemgetter(1))
             if top_count > 1 and top_operator:
                 summary_parts.append(f"{top_count} to {_format_name(top_operator)}")
     
     # Caller information (if query was person-specific)
-    if len(caller_counts) == 1 and any(name in original_query.lower() for name in caller_counts.keys() if name):
+    if len(caller_counts) == 1 and any(name in query_lower for name in caller_counts.keys() if name):
         # Single caller query
         caller_name = list(caller_counts.keys())[0]
         if caller_name:
             summary_parts.append(f"for {_format_name(caller_name)}")
     
     # Time context
-    if "recent" in original_query.lower() or "last" in original_query.lower():
-        summary_parts.append("(recent)")
-    elif any(word in original_query.lower() for word in ["today", "yesterday"]):
+    if any(word in query_lower for word in _RECENT_WORDS):
         summary_parts.append("(recent)")
     
-    # Join with appropriate separators
+    # Join with appropriate separators; commas for multiple parts
     if len(summary_parts) <= 2:
         summary = " ".join(summary_parts)
     else:
-        # Use commas for multiple parts
-        summary = summary_parts[0]
-        for i, part in enumerate(summary_parts[1:], 1):
-            if i == len(summary_parts) - 1:
-                summary += f", {part}"
-            else:
-                summary += f", {part}"
+        summary = ", ".join(summary_parts)
     
     # Ensure sentence ends properly
     if not summary.endswith('.'):
@@ -104,11 +119,11 @@ def summarize_incidents(incidents: List[NormalizedIncident], original_query: str
     return summary
 
 
-def _format_counter_summary(counter: Counter, category: str, top_n: int = 3) -> str:
-    """Format a counter into a summary string.
+def _format_counter_summary(counter: Mapping[str, int], category: str, top_n: int = 3) -> str:
+    """Format item counts into a summary string.
     
     Args:
-        counter: Counter object with item counts
+        counter: Mapping of items to their counts
         category: Category name for context
         top_n: Maximum number of items to include
         
@@ -119,7 +134,8 @@ def _format_counter_summary(counter: Counter, category: str, top_n: int = 3) ->
         return ""
     
     total = sum(counter.values())
-    most_common = counter.most_common(top_n)
+    # Same selection and tie order as Counter.most_common
+    most_common = heapq.nlargest(top_n, counter.items(), key=itemgetter(1))
     
     if len(most_common) == 1:
         item, count = most_common[0]
@@ -316,9 +332,10 @@ def generate_error_summary(error_msg: str, query: str = "") -> str:
         return "Too many requests. Please wait a moment before trying again."
     
     elif "not found" in error_lower:
-        if query and any(word in query.lower() for word in ["person", "user", "caller"]):
+        query_lower = query.lower()
+        if query and any(word in query_lower for word in _PERSON_WORDS):
             return "The person you're looking for was not found. Please check the name spelling."
-        elif query and any(word in query.lower() for word in ["operator", "technician"]):
+        elif query and any(word in query_lower for word in _OPERATOR_WORDS):
             return "The operator you're looking for was not found. Please check the name spelling."
         else:
             return "The requested information was not found."
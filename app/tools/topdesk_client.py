@@ -3,14 +3,34 @@
 import asyncio
 import logging
 import random
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import httpx
+import orjson
 from ..config import settings
 from ..security import security_manager
 
 
 logger = logging.getLogger(__name__)
 
+# HTTP/2 needs the optional h2 package (httpx[http2])
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# Allowed tools for security
+_ALLOWED_TOOLS = frozenset({
+    "search",
+    "topdesk_get_incidents_by_fiql_query",
+    "topdesk_get_person_by_query",
+    "topdesk_get_operators_by_fiql_query",
+    "topdesk_get_complete_incident_overview"
+})
+
+# Larger error bodies are not decoded for their message
+_MAX_ERROR_BODY_BYTES = 4096
+
 
 class MCPClientError(Exception):
     """Base exception for MCP client errors."""
@@ -47,6 +67,13 @@ class TopdeskMCPClient:
             self.topdesk_url = settings.topdesk_url
             self.topdesk_username = settings.topdesk_username
             self.topdesk_password = settings.topdesk_password
+            self._direct_handlers = {
+                "topdesk_get_incidents_by_fiql_query": self._direct_incidents_fiql,
+                "topdesk_get_person_by_query": self._direct_person,
+                "topdesk_get_operators_by_fiql_query": self._direct_operators,
+                "topdesk_get_complete_incident_overview": self._direct_incident_overview,
+                "search": self._direct_search,
+            }
             logger.info("Using direct TOPDESK connection mode")
         else:
             # MCP server mode
@@ -54,29 +81,33 @@ class TopdeskMCPClient:
             
         self.timeout = settings.mcp_timeout
         self.retries = settings.mcp_retries
+        self.max_backoff = settings.mcp_max_backoff
         
-        # Allowed tools for security
-        self.allowed_tools = {
-            "search",
-            "topdesk_get_incidents_by_fiql_query", 
-            "topdesk_get_person_by_query",
-            "topdesk_get_operators_by_fiql_query",
-            "topdesk_get_complete_incident_overview"
-        }
+        if not self.direct_mode:
+            # Endpoint per allowed tool, built once instead of on every call
+            self._tool_urls = {tool: f"{self.base_url}/tools/{tool}" for tool in _ALLOWED_TOOLS}
         
         self._client: Optional[httpx.AsyncClient] = None
         self._topdesk_client = None  # For direct mode
     
     async def __aenter__(self):
         """Async context manager entry."""
+        await self.connect()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.disconnect()
+    
+    async def connect(self):
+        """Open the underlying connection so it can be reused across calls."""
         if self.direct_mode:
             await self._ensure_direct_client()
         else:
             await self._ensure_client()
-        return self
     
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
+    async def disconnect(self):
+        """Close the underlying connection opened by connect()."""
         await self.close()
     
     async def _ensure_direct_client(self):
@@ -84,8 +115,10 @@ class TopdeskMCPClient:
         if self._topdesk_client is None:
             # Import here to avoid circular dependency
             from topdesk_mcp import _topdesk_sdk as topdesk_sdk
-            self._topdesk_client = topdesk_sdk.connect(
-                self.topdesk_url, 
+            # The SDK connects synchronously; keep it off the event loop
+            self._topdesk_client = await asyncio.to_thread(
+                topdesk_sdk.connect,
+                self.topdesk_url,
                 self.topdesk_username, 
                 self.topdesk_password
             )
@@ -104,7 +137,9 @@ class TopdeskMCPClient:
             
             self._client = httpx.AsyncClient(
                 timeout=httpx.Timeout(self.timeout),
-                headers=headers
+                headers=headers,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                http2=_HTTP2_AVAILABLE
             )
     
     async def close(self):
@@ -131,7 +166,7 @@ class TopdeskMCPClient:
             MCPServerError: If server returns an error
         """
         # Validate tool is allowed
-        if tool_name not in self.allowed_tools:
+        if tool_name not in _ALLOWED_TOOLS:
             raise MCPClientError(f"Tool '{tool_name}' is not allowed")
         
         if self.direct_mode:
@@ -139,37 +174,37 @@ class TopdeskMCPClient:
         else:
             return await self._call_tool_mcp(tool_name, payload)
     
+    async def call_many(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        """Call several independent tools concurrently.
+        
+        The calls share the client's connection pool, so the total latency is
+        that of the slowest call rather than the sum of all calls.
+        
+        Args:
+            calls: (tool_name, payload) pairs
+            
+        Returns:
+            Responses in the order of calls; a failed call yields its exception
+        """
+        return await asyncio.gather(
+            *(self.call_tool(tool_name, payload) for tool_name, payload in calls),
+            return_exceptions=True
+        )
+    
     async def _call_tool_direct(self, tool_name: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Call tool directly with TOPDESK API."""
         if not self._topdesk_client:
             raise MCPClientError("Direct TOPDESK client not initialized")
         
         try:
-            # Map tool names to direct SDK calls
-            if tool_name == "topdesk_get_incidents_by_fiql_query":
-                fiql_query = payload.get("fiql_query", "")
-                page_size = payload.get("page_size", 10)
-                result = self._topdesk_client.incident.get_list(page_size=page_size, query=fiql_query)
-            elif tool_name == "topdesk_get_person_by_query":
-                fiql_query = payload.get("fiql_query", "")
-                result = self._topdesk_client.person.get_list(query=fiql_query)
-            elif tool_name == "topdesk_get_operators_by_fiql_query":
-                fiql_query = payload.get("fiql_query", "")
-                result = self._topdesk_client.operator.get_list(query=fiql_query)
-            elif tool_name == "topdesk_get_complete_incident_overview":
-                incident_id = payload.get("incident_id", "")
-                if self._topdesk_client.utils.is_valid_uuid(incident_id):
-                    result = self._topdesk_client.incident.get_by_id(incident_id)
-                else:
-                    result = self._topdesk_client.incident.get_by_number(incident_id)
-            elif tool_name == "search":
-                # For search, we'll use incident search as default
-                query = payload.get("query", "")
-                max_results = payload.get("max_results", 5)
-                result = self._topdesk_client.incident.get_list(page_size=max_results, query=query)
-            else:
+            handler = self._direct_handlers.get(tool_name)
+            if handler is None:
                 raise MCPClientError(f"Direct mode not implemented for tool '{tool_name}'")
             
+            # The TOPDESK SDK is synchronous; run it in a worker thread so a
+            # slow call does not block other requests on the event loop
+            result = await asyncio.to_thread(handler, payload)
+            
             logger.debug(f"Direct TOPDESK tool {tool_name} succeeded")
             return result
             
@@ -177,6 +212,36 @@ class TopdeskMCPClient:
             logger.error(f"Direct TOPDESK tool {tool_name} failed: {e}")
             raise MCPClientError(f"Direct TOPDESK call failed: {str(e)}")
     
+    def _direct_incidents_fiql(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """List incidents matching a FIQL query with the TOPDESK SDK."""
+        fiql_query = payload.get("fiql_query", "")
+        page_size = payload.get("page_size", 10)
+        return self._topdesk_client.incident.get_list(page_size=page_size, query=fiql_query)
+    
+    def _direct_person(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """List persons matching a FIQL query with the TOPDESK SDK."""
+        fiql_query = payload.get("fiql_query", "")
+        return self._topdesk_client.person.get_list(query=fiql_query)
+    
+    def _direct_operators(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """List operators matching a FIQL query with the TOPDESK SDK."""
+        fiql_query = payload.get("fiql_query", "")
+        return self._topdesk_client.operator.get_list(query=fiql_query)
+    
+    def _direct_incident_overview(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Get one incident by id or number with the TOPDESK SDK."""
+        incident_id = payload.get("incident_id", "")
+        if self._topdesk_client.utils.is_valid_uuid(incident_id):
+            return self._topdesk_client.incident.get_by_id(incident_id)
+        return self._topdesk_client.incident.get_by_number(incident_id)
+    
+    def _direct_search(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Search incidents with the TOPDESK SDK."""
+        # For search, we'll use incident search as default
+        query = payload.get("query", "")
+        max_results = payload.get("max_results", 5)
+        return self._topdesk_client.incident.get_list(page_size=max_results, query=query)
+    
     async def _call_tool_mcp(self, tool_name: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Call tool via MCP server."""
         
@@ -186,53 +251,16 @@ class TopdeskMCPClient:
         
         await self._ensure_client()
         
-        url = f"{self.base_url}/tools/{tool_name}"
+        url = self._tool_urls[tool_name]
         
-        # Retry logic with exponential backoff and jitter
+        # Retry transport errors with capped exponential backoff and jitter;
+        # HTTP error responses are raised by _do_request without retrying
         last_exception = None
         
         for attempt in range(self.retries + 1):
             try:
                 logger.debug(f"Calling MCP tool {tool_name}, attempt {attempt + 1}")
-                
-                response = await self._client.post(url, json=payload)
-                
-                # Handle different response codes
-                if response.status_code == 200:
-                    await security_manager.record_mcp_success()
-                    result = response.json()
-                    logger.debug(f"MCP tool {tool_name} succeeded")
-                    return result
-                
-                elif response.status_code == 404:
-                    raise MCPClientError(f"Tool '{tool_name}' not found on MCP server")
-                
-                elif response.status_code == 429:
-                    # Rate limited by MCP server
-                    raise MCPClientError("Rate limited by MCP server")
-                
-                elif 500 <= response.status_code < 600:
-                    # Server error - will trigger circuit breaker
-                    error_msg = f"MCP server error {response.status_code}"
-                    try:
-                        error_detail = response.json().get("error", {})
-                        error_msg = f"{error_msg}: {error_detail.get('message', 'Unknown error')}"
-                    except:
-                        pass
-                    
-                    await security_manager.record_mcp_failure()
-                    raise MCPServerError(error_msg)
-                
-                else:
-                    # Other client errors
-                    error_msg = f"MCP client error {response.status_code}"
-                    try:
-                        error_detail = response.json().get("error", {})
-                        error_msg = f"{error_msg}: {error_detail.get('message', 'Unknown error')}"
-                    except:
-                        pass
-                    
-                    raise MCPClientError(error_msg)
+                return await self._do_request(tool_name, url, payload)
             
             except httpx.TimeoutException as e:
                 last_exception = MCPTimeoutError(f"MCP request timed out after {self.timeout}s")
@@ -244,13 +272,8 @@ class TopdeskMCPClient:
                 logger.warning(f"MCP tool {tool_name} request failed: {e}, attempt {attempt + 1}")
                 await security_manager.record_mcp_failure()
             
-            except (MCPClientError, MCPServerError, MCPCircuitOpenError):
-                # Don't retry these errors
-                raise
-            
-            # Wait before retry with exponential backoff and jitter
             if attempt < self.retries:
-                wait_time = (2 ** attempt) + random.uniform(0, 1)
+                wait_time = min(2 ** attempt + random.random(), self.max_backoff)
                 logger.debug(f"Waiting {wait_time:.2f}s before retry")
                 await asyncio.sleep(wait_time)
         
@@ -260,6 +283,72 @@ class TopdeskMCPClient:
         else:
             raise MCPClientError(f"Failed to call tool {tool_name} after {self.retries + 1} attempts")
     
+    async def _do_request(self, tool_name: str, url: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Send one request to the MCP server and map its status code.
+        
+        Args:
+            tool_name: Name of the tool being called
+            url: Tool endpoint URL
+            payload: Payload to send to the tool
+            
+        Returns:
+            Decoded response body
+            
+        Raises:
+            MCPClientError: If the server returns a client error
+            MCPServerError: If the server returns a server error
+            httpx.RequestError: If the request fails at the transport level
+        """
+        response = await self._client.post(url, json=payload)
+        
+        if response.status_code == 200:
+            await security_manager.record_mcp_success()
+            result = orjson.loads(response.content)
+            logger.debug(f"MCP tool {tool_name} succeeded")
+            return result
+        
+        elif response.status_code == 404:
+            raise MCPClientError(f"Tool '{tool_name}' not found on MCP server")
+        
+        elif response.status_code == 429:
+            # Rate limited by MCP server
+            raise MCPClientError("Rate limited by MCP server")
+        
+        elif 500 <= response.status_code < 600:
+            # Server error - will trigger circuit breaker
+            error_msg = self._error_message(f"MCP server error {response.status_code}", response)
+            
+            await security_manager.record_mcp_failure()
+            raise MCPServerError(error_msg)
+        
+        else:
+            # Other client errors
+            error_msg = self._error_message(f"MCP client error {response.status_code}", response)
+            raise MCPClientError(error_msg)
+    
+    @staticmethod
+    def _error_message(prefix: str, response: httpx.Response) -> str:
+        """Append the server's error message to an error prefix when available.
+        
+        Only small JSON bodies are decoded; HTML error pages and large bodies
+        are not worth parsing just to build an exception message.
+        
+        Args:
+            prefix: Error description based on the status code
+            response: Failed HTTP response
+            
+        Returns:
+            Error message for the raised exception
+        """
+        if ("json" in response.headers.get("content-type", "")
+                and len(response.content) <= _MAX_ERROR_BODY_BYTES):
+            try:
+                error_detail = orjson.loads(response.content).get("error", {})
+                return f"{prefix}: {error_detail.get('message', 'Unknown error')}"
+            except Exception:
+                pass
+        return prefix
+    
     async def health_check(self) -> Dict[str, Any]:
         """Check if MCP server or direct TOPDESK connection is healthy.
         
@@ -272,8 +361,8 @@ class TopdeskMCPClient:
                 if not self._topdesk_client:
                     await self._ensure_direct_client()
                 
-                # Try a simple query to check connectivity
-                result = self._topdesk_client.incident.get_list(page_size=1)
+                # Try a simple query to check connectivity, off the event loop
+                result = await asyncio.to_thread(self._topdesk_client.incident.get_list, page_size=1)
                 return {
                     "status": "healthy",
                     "connection_mode": "direct_topdesk",
@@ -324,6 +413,36 @@ class TopdeskMCPClient:
 
 # Helper functions for common MCP calls
 
+# Client shared by the helpers and the app, so they reuse pooled connections
+_shared_client: Optional[TopdeskMCPClient] = None
+# Serializes first use so concurrent callers do not each open a client
+_shared_client_lock = asyncio.Lock()
+
+
+async def get_client() -> TopdeskMCPClient:
+    """Return the shared MCP client, connecting it on first use.
+    
+    Returns:
+        Connected TopdeskMCPClient
+    """
+    global _shared_client
+    if _shared_client is None:
+        async with _shared_client_lock:
+            if _shared_client is None:
+                client = TopdeskMCPClient()
+                await client.connect()
+                _shared_client = client
+    return _shared_client
+
+
+async def close_client() -> None:
+    """Close the shared MCP client, if one was opened."""
+    global _shared_client
+    if _shared_client is not None:
+        client, _shared_client = _shared_client, None
+        await client.disconnect()
+
+
 async def search_incidents(query: str, max_results: int = 5) -> Dict[str, Any]:
     """Search for incidents using the search tool.
     
@@ -334,11 +453,11 @@ async def search_incidents(query: str, max_results: int = 5) -> Dict[str, Any]:
     Returns:
         Search results from MCP server
     """
-    async with TopdeskMCPClient() as client:
-        return await client.call_tool("search", {
-            "query": query,
-            "max_results": max_results
-        })
+    client = await get_client()
+    return await client.call_tool("search", {
+        "query": query,
+        "max_results": max_results
+    })
 
 
 async def get_incidents_by_fiql(fiql_query: str, page_size: int = 5) -> Dict[str, Any]:
@@ -351,11 +470,11 @@ async def get_incidents_by_fiql(fiql_query: str, page_size: int = 5) -> Dict[str
     Returns:
         Incidents matching the FIQL query
     """
-    async with TopdeskMCPClient() as client:
-        return await client.call_tool("topdesk_get_incidents_by_fiql_query", {
-            "fiql_query": fiql_query,
-            "page_size": page_size
-        })
+    client = await get_client()
+    return await client.call_tool("topdesk_get_incidents_by_fiql_query", {
+        "fiql_query": fiql_query,
+        "page_size": page_size
+    })
 
 
 async def get_person_by_query(fiql_query: str) -> Dict[str, Any]:
@@ -367,10 +486,10 @@ async def get_person_by_query(fiql_query: str) -> Dict[str, Any]:
     Returns:
         Person information from MCP server
     """
-    async with TopdeskMCPClient() as client:
-        return await client.call_tool("topdesk_get_person_by_query", {
-            "fiql_query": fiql_query
-        })
+    client = await get_client()
+    return await client.call_tool("topdesk_get_person_by_query", {
+        "fiql_query": fiql_query
+    })
 
 
 async def get_operators_by_fiql(fiql_query: str) -> Dict[str, Any]:
@@ -382,10 +501,10 @@ async def get_operators_by_fiql(fiql_query: str) -> Dict[str, Any]:
     Returns:
         Operators matching the query
     """
-    async with TopdeskMCPClient() as client:
-        return await client.call_tool("topdesk_get_operators_by_fiql_query", {
-            "fiql_query": fiql_query
-        })
+    client = await get_client()
+    return await client.call_tool("topdesk_get_operators_by_fiql_query", {
+        "fiql_query": fiql_query
+    })
 
 
 async def get_complete_incident_overview(incident_id: str) -> Dict[str, Any]:
@@ -397,7 +516,20 @@ async def get_complete_incident_overview(incident_id: str) -> Dict[str, Any]:
     Returns:
         Complete incident information
     """
-    async with TopdeskMCPClient() as client:
-        return await client.call_tool("topdesk_get_complete_incident_overview", {
-            "incident_id": incident_id
-        })
\ No newline at end of file
+    client = await get_client()
+    return await client.call_tool("topdesk_get_complete_incident_overview", {
+        "incident_id": incident_id
+    })
+
+
+async def call_many(calls: List[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+    """Call several independent tools concurrently on the shared client.
+    
+    Args:
+        calls: (tool_name, payload) pairs
+        
+    Returns:
+        Responses in the order of calls; a failed call yields its exception
+    """
+    client = await get_client()
+    return await client.call_many(calls)
@@ -6,6 +6,10 @@ from typing import Optional, List
 from .fiql import validate_fiql
 
 
+# TOPdesk incident numbers typically follow pattern: I-YYMMDD-NNN
+_INCIDENT_NUMBER_RE = re.compile(r'I-\d{6}-\d{3}')
+
+
 class ValidationError(Exception):
     """Custom validation error."""
     pass
@@ -96,11 +100,9 @@ def validate_incident_number(value: str) -> str:
     if not value:
         raise ValidationError("Incident number cannot be empty")
     
-    # TOPdesk incident numbers typically follow pattern: I-YYMMDD-NNN
     # Make it case-insensitive
     value = value.upper()
-    pattern = r'^I-\d{6}-\d{3}$'
-    if not re.match(pattern, value):
+    if not _INCIDENT_NUMBER_RE.fullmatch(value):
         raise ValidationError(f"Invalid incident number format: {value}. Expected format: I-YYMMDD-NNN")
     
     return value
@@ -1,11 +1,11 @@
 """Tests for FIQL query building utilities."""
 
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from app.fiql import (
     quote_value, and_join, or_join, equals, not_equals, starts_with,
-    greater_equal, in_list, build_person_query, build_operator_query,
-    build_incident_query, validate_fiql, sanitize_fiql, days_ago
+    greater_equal, in_list, build_person_query, build_person_query_from_parts,
+    build_operator_query, build_incident_query, validate_fiql, sanitize_fiql, days_ago
 )
 
 
@@ -95,6 +95,11 @@ class TestQueryBuilding:
         result = build_person_query(email="john@example.com")
         assert result == "email=='john@example.com'"
     
+    def test_build_person_query_from_parts(self):
+        assert build_person_query_from_parts(["John", "van", "Doe"]) == "firstName=='John';surname=='Doe'"
+        assert build_person_query_from_parts(["Doe"]) == "surname=='Doe'"
+        assert build_person_query_from_parts([]) == ""
+    
     def test_build_operator_query_exact(self):
         result = build_operator_query("Jane Smith", exact=True)
         assert result == "name=='Jane Smith'"
@@ -165,4 +170,16 @@ class TestDateHandling:
         assert "Z" in result
         # Should be approximately 7 days ago
         expected_date = (datetime.utcnow() - timedelta(days=7)).date()
-        assert expected_date.strftime("%Y-%m-%d") in result
\ No newline at end of file
+        assert expected_date.strftime("%Y-%m-%d") in result
+    
+    def test_days_ago_with_reference_time(self):
+        """Test that days_ago counts back from the given reference time."""
+        now = datetime(2024, 3, 8, 12, 30, 15)
+        assert days_ago(7, now) == "2024-03-01T12:30:15Z"
+    
+    def test_days_ago_converts_to_utc(self):
+        """Test that equal instants in different zones give the same UTC timestamp."""
+        utc = datetime(2024, 3, 8, 10, 0, 0, tzinfo=timezone.utc)
+        cest = datetime(2024, 3, 8, 12, 0, 0, tzinfo=timezone(timedelta(hours=2)))
+        assert days_ago(1, utc) == "2024-03-07T10:00:00Z"
+        assert days_ago(1, cest) == "2024-03-07T10:00:00Z"
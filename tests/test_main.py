@@ -0,0 +1,52 @@
+"""Tests for the FastAPI endpoints."""
+
+import orjson
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from app.main import health_check, root
+from app.schemas import ServiceInfoResponse
+
+
+class TestRoot:
+    """Test the root endpoint."""
+    
+    @pytest.mark.asyncio
+    async def test_fresh_response_per_request(self):
+        """Test that each request gets its own response with the service info."""
+        first = await root()
+        second = await root()
+        
+        assert first is not second
+        info = ServiceInfoResponse.model_validate(orjson.loads(first.body))
+        assert info.endpoints["query"] == "POST /ask"
+        assert first.headers["cache-control"] == "public, max-age=3600"
+
+
+class TestHealth:
+    """Test health reporting without a connected MCP client."""
+    
+    @pytest.mark.asyncio
+    async def test_unreachable_backend_reports_unhealthy(self):
+        """Test that /health reports an unreachable backend instead of failing."""
+        request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace()))
+        
+        with patch('app.main.get_client', AsyncMock(side_effect=ConnectionError("down"))):
+            health = await health_check(request)
+        
+        assert health.status == "unhealthy"
+    
+    @pytest.mark.asyncio
+    async def test_connects_lazily(self):
+        """Test that /health connects the shared client when startup could not."""
+        request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(mcp_client=None)))
+        client = AsyncMock()
+        client.health_check.return_value = {"status": "healthy"}
+        
+        with patch('app.main.get_client', AsyncMock(return_value=client)), \
+                patch('app.main.query_router') as router:
+            health = await health_check(request)
+        
+        assert health.status == "healthy"
+        assert request.app.state.mcp_client is client
+        assert router.mcp_client is client
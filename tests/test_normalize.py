@@ -0,0 +1,108 @@
+"""Tests for MCP response normalization utilities."""
+
+import pytest
+from app.normalize import (
+    iter_normalized_incidents, normalize_datetime, normalize_incidents_response,
+    sanitize_for_logging
+)
+
+
+class TestNormalizeDatetime:
+    """Test datetime normalization."""
+
+    @pytest.mark.parametrize("raw, expected", [
+        ("2024-01-01T10:00:00.123Z", "2024-01-01 10:00:00"),
+        ("2024-01-01T10:00:00.123456Z", "2024-01-01 10:00:00"),
+        ("2024-01-01T10:00:00Z", "2024-01-01 10:00:00"),
+        ("2024-01-01T10:00:00", "2024-01-01 10:00:00"),
+        ("2024-01-01 10:00:00", "2024-01-01 10:00:00"),
+        ("2024-01-01", "2024-01-01 00:00:00"),
+    ])
+    def test_supported_formats(self, raw, expected):
+        assert normalize_datetime(raw) == expected
+
+    def test_non_padded_fields(self):
+        assert normalize_datetime("2024-1-5") == "2024-01-05 00:00:00"
+
+    @pytest.mark.parametrize("raw", [
+        "2024-02-30",
+        "2024-13-01T00:00:00",
+        "2024-01-01T10:00:00.123",
+        "2024-01-01 10:00:00Z",
+        "2024-01-01T10:00:00+01:00",
+        "not a date",
+    ])
+    def test_unsupported_returned_unchanged(self, raw):
+        assert normalize_datetime(raw) == raw
+
+    def test_empty(self):
+        assert normalize_datetime(None) == ""
+        assert normalize_datetime("") == ""
+
+
+class TestNormalizeIncidentsResponse:
+    """Test incident list normalization."""
+
+    def test_incidents_key(self):
+        response = {"incidents": [{
+            "id": "123",
+            "number": "I-240101-001",
+            "briefDescription": "Email not working",
+            "status": {"name": "Open"},
+            "creationDate": "2024-01-01T10:00:00Z",
+            "priority": {"name": "High"},
+            "caller": {"firstName": "John", "surname": "Doe"},
+        }]}
+        [incident] = normalize_incidents_response(response)
+        assert incident.number == "I-240101-001"
+        assert incident.status == "Open"
+        assert incident.created_at == "2024-01-01 10:00:00"
+        assert incident.priority == "High"
+        assert incident.caller == "John Doe"
+
+    def test_malformed_incident_falls_back(self):
+        response = [
+            {"id": "1", "number": "I-1", "status": "Open"},
+            {"id": "2", "number": "I-2", "status": {"name": ["not", "a", "string"]}},
+            "not an incident",
+        ]
+        incidents = normalize_incidents_response(response)
+        assert [i.number for i in incidents] == ["I-1", "I-2"]
+        assert incidents[0].status == "Open"
+        assert incidents[1].status == "Unknown"
+
+    def test_iter_matches_list(self):
+        response = {"data": [{"id": "1", "number": "I-1"}, 42, {"id": "2", "number": "I-2"}]}
+        streamed = iter_normalized_incidents(response)
+        assert not isinstance(streamed, list)
+        assert list(streamed) == normalize_incidents_response(response)
+
+    def test_unexpected_response_type(self):
+        assert normalize_incidents_response("oops") == []
+        assert list(iter_normalized_incidents("oops")) == []
+
+
+class TestSanitizeForLogging:
+    """Test log sanitization."""
+
+    def test_removes_pii_fields(self):
+        data = {"id": "1", "email": "a@b.c", "personalDetails": {"x": 1}, "apiToken": "t"}
+        assert sanitize_for_logging(data) == {"id": "1"}
+
+    def test_truncates_text_fields(self):
+        result = sanitize_for_logging({"briefDescription": "x" * 150})
+        assert result["briefDescription"] == "x" * 100 + "..."
+
+    def test_limits_depth_and_list_size(self):
+        data = {"a": {"b": {"c": {"d": 1}}}, "items": list(range(10))}
+        result = sanitize_for_logging(data)
+        assert result == {"a": {"b": {"c": "..."}}, "items": [0, 1, 2, 3, 4]}
+
+    def test_preserves_key_order(self):
+        data = {"z": {"k": 1}, "a": 2, "m": [3]}
+        assert list(sanitize_for_logging(data)) == ["z", "a", "m"]
+
+    def test_scalars(self):
+        assert sanitize_for_logging("x" * 250) == "x" * 200 + "..."
+        assert sanitize_for_logging(5) == 5
+        assert sanitize_for_logging(5, max_depth=0) == "..."
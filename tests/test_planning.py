@@ -1,7 +1,7 @@
 """Tests for natural language query planning."""
 
 import pytest
-from app.planning import QueryPlanner
+from app.planning import QueryPlanner, load_warmup_queries
 from app.schemas import QueryPlan
 
 
@@ -64,6 +64,42 @@ class TestQueryPlanner:
         assert "Invalid incident number format" in plan.clarify
         assert len(plan.tool_calls) == 0
     
+    def test_complete_incident_requires_whole_word(self):
+        """Test that words merely containing 'all' do not trigger an overview."""
+        plan = self.planner.plan_query("incident I-240101-001 reported by the caller")
+        
+        assert all(call.name != "topdesk_get_complete_incident_overview" for call in plan.tool_calls)
+        assert "Invalid incident number format" not in (plan.clarify or "")
+    
+    def test_complete_incident_accepts_inflected_words(self):
+        """Test that inflected forms such as plurals still trigger an overview."""
+        for query in ["overviews of I-240101-001", "show I-240101-001 fully"]:
+            plan = self.planner.plan_query(query)
+            
+            assert plan.tool_calls[0].name == "topdesk_get_complete_incident_overview"
+    
+    def test_repeated_query_reuses_intents(self):
+        """Test that repeated queries hit the intent cache but get fresh plans."""
+        first = self.planner.plan_query("open tickets for John Doe")
+        second = self.planner.plan_query("  Open tickets for John Doe ")
+        
+        assert self.planner._detect_intents.cache_info().hits == 1
+        assert second is not first
+        assert second.tool_calls[0].payload == first.tool_calls[0].payload
+    
+    def test_plan_queries_batch(self):
+        """Test batch planning keeps order and shares one time reference."""
+        queries = ["tickets for John Doe", "email problem", "incidents assigned to Jane Smith"]
+        plans = self.planner.plan_queries(queries, max_results=3)
+        
+        assert [plan.intent for plan in plans] == [
+            self.planner.plan_query(query).intent for query in queries
+        ]
+        person_query = plans[0].tool_calls[1].payload["query"]
+        operator_query = plans[2].tool_calls[1].payload["query"]
+        assert person_query.split(";")[-1] == operator_query.split(";")[-1]
+        assert plans[2].tool_calls[1].payload["page_size"] == 3
+    
     def test_category_query_changes(self):
         """Test planning for change/RFC queries."""
         plan = self.planner.plan_query("show me recent changes", max_results=5)
@@ -101,6 +137,14 @@ class TestQueryPlanner:
         # Test "3 weeks ago"
         assert self.planner._extract_time_constraint("incidents 3 weeks ago") == 21
     
+    def test_time_constraint_periods(self):
+        """Test month periods and the first expression winning."""
+        assert self.planner._extract_time_constraint("changes last month") == 60
+        assert self.planner._extract_time_constraint("incidents 2 months ago") == 60
+        assert self.planner._extract_time_constraint("past 3 weeks") == 21
+        assert self.planner._extract_time_constraint("today, not last week") == 1
+        assert self.planner._extract_time_constraint("no time here") is None
+    
     def test_search_query(self):
         """Test planning for simple search queries."""
         plan = self.planner.plan_query("email problem", max_results=5)
@@ -130,6 +174,22 @@ class TestQueryPlanner:
         assert "priority.name" in fiql_query
         assert "status!=" in fiql_query
         assert "creationDate=ge=" in fiql_query
+    
+    def test_warm_up_fills_intent_cache(self):
+        """Test that warm-up queries are served from the intent cache."""
+        assert self.planner.warm_up(["Open incidents for John Doe", "email problem"]) == 2
+        
+        self.planner.plan_query("open incidents for john doe")
+        
+        assert self.planner._detect_intents.cache_info().hits == 1
+    
+    def test_load_warmup_queries(self, tmp_path):
+        """Test reading warm-up queries from a file."""
+        path = tmp_path / "queries.txt"
+        path.write_text("# popular queries\nemail problem\n\n  open incidents  \n", encoding="utf-8")
+        
+        assert load_warmup_queries(str(path)) == ["email problem", "open incidents"]
+        assert load_warmup_queries(str(tmp_path / "missing.txt")) == []
 
 
 class TestIntentDetection:
@@ -151,6 +211,11 @@ class TestIntentDetection:
         assert self.planner._extract_operator_name("operator Jane Smith") == "Jane Smith"
         assert self.planner._extract_operator_name("no operator here") is None
     
+    def test_extract_names_mixed_case(self):
+        """Test that name extraction accepts queries that are not lower-cased."""
+        assert self.planner._extract_person_name("Tickets of John Smith") == "John Smith"
+        assert self.planner._extract_operator_name("Assigned to Jane Doe") == "Jane Doe"
+    
     def test_extract_incident_id(self):
         """Test incident ID extraction."""
         assert self.planner._extract_incident_id("incident I-240101-001") == "I-240101-001"
@@ -166,12 +231,17 @@ class TestIntentDetection:
         assert self.planner._extract_status("pending requests") == "open"
         assert self.planner._extract_status("no status here") is None
     
+    def test_extract_status_open_words(self):
+        """Test the open-status fallback matches whole words only."""
+        assert self.planner._extract_status("show active requests") == "open"
+        assert self.planner._extract_status("reopened requests") is None
+    
     def test_extract_priority(self):
         """Test priority extraction."""
-        assert self.planner._extract_priority("high priority tickets") == ["High"]
-        assert self.planner._extract_priority("critical incidents") == ["Critical"]
-        assert self.planner._extract_priority("urgent issues") == ["Critical"]
-        assert self.planner._extract_priority("medium priority") == ["Medium"]
+        assert self.planner._extract_priority("high priority tickets") == ("High",)
+        assert self.planner._extract_priority("critical incidents") == ("Critical",)
+        assert self.planner._extract_priority("urgent issues") == ("Critical",)
+        assert self.planner._extract_priority("medium priority") == ("Medium",)
         assert self.planner._extract_priority("no priority here") is None
     
     def test_extract_category(self):
@@ -2,8 +2,8 @@
 
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
-from app.router import QueryRouter
-from app.schemas import QueryRequest, NormalizedIncident
+from app.router import QueryRouter, ToolResult
+from app.schemas import QueryRequest, QueryResponse, QueryPlan, ToolCall, NormalizedIncident
 
 
 class TestQueryRouterIntegration:
@@ -200,6 +200,14 @@ class TestQueryRouterNormalization:
     def setup_method(self):
         self.router = QueryRouter()
     
+    @staticmethod
+    def _results(raw_responses):
+        """Build tool results from step-keyed raw responses."""
+        return [
+            ToolResult.from_response(step, ToolCall(name=key.split("_", 2)[2], payload={}), response)
+            for step, (key, response) in enumerate(raw_responses.items(), 1)
+        ]
+    
     @pytest.mark.asyncio
     async def test_normalize_incidents_response(self):
         """Test incident normalization from raw MCP response."""
@@ -222,7 +230,7 @@ class TestQueryRouterNormalization:
         plan = MagicMock()
         plan.intent = "test"
         
-        incidents, extra_info = await self.router._normalize_results(plan, raw_responses)
+        incidents, extra_info = await self.router._normalize_results(plan, self._results(raw_responses))
         
         assert len(incidents) == 1
         assert incidents[0].id == "123"
@@ -251,9 +259,130 @@ class TestQueryRouterNormalization:
         }
         
         plan = MagicMock()
-        incidents, extra_info = await self.router._normalize_results(plan, raw_responses)
+        incidents, extra_info = await self.router._normalize_results(plan, self._results(raw_responses))
         
         assert "person" in extra_info
         assert extra_info["person"]["id"] == "person-123"
         assert extra_info["person"]["name"] == "John Doe"
-        assert extra_info["person"]["email"] == "john.doe@example.com"
\ No newline at end of file
+        assert extra_info["person"]["email"] == "john.doe@example.com"
+
+
+class TestQueryRouterExecution:
+    """Test tool call execution in the router."""
+    
+    def setup_method(self):
+        self.router = QueryRouter()
+    
+    def test_partition_waves(self):
+        """Test that dependent calls start a new wave."""
+        calls = [
+            ToolCall(name="topdesk_get_person_by_query", payload={"query": "surname=='Doe'"}),
+            ToolCall(name="search", payload={"query": "email"}),
+            ToolCall(name="topdesk_get_incidents_by_fiql_query", payload={"query": "caller.id==PLACEHOLDER"}),
+        ]
+        
+        waves = self.router._partition_waves(calls)
+        
+        assert [[i for i, _ in wave] for wave in waves] == [[0, 1], [2]]
+    
+    @pytest.mark.asyncio
+    async def test_resolve_placeholder_uses_normalized_lookup(self):
+        """Test that placeholders are filled from already normalized lookups."""
+        results = [
+            ToolResult.from_response(1, ToolCall(name="topdesk_get_operators_by_fiql_query", payload={}),
+                                     {"id": "op-1", "name": "Jane Smith"}),
+            ToolResult.from_response(2, ToolCall(name="topdesk_get_person_by_query", payload={}),
+                                     {"persons": [{"id": "person-123", "surname": "Doe"}]}),
+        ]
+        tool_call = ToolCall(
+            name="topdesk_get_incidents_by_fiql_query",
+            payload={"fiql_query": "caller.id==PLACEHOLDER;status!=Closed"}
+        )
+        
+        resolved = await self.router._resolve_placeholder(tool_call, results)
+        
+        assert resolved.payload["fiql_query"] == "caller.id=='person-123';status!=Closed"
+        assert tool_call.payload["fiql_query"] == "caller.id==PLACEHOLDER;status!=Closed"
+    
+    @pytest.mark.asyncio
+    async def test_resolve_placeholder_in_planned_payload(self):
+        """Test placeholders in the query field the planner emits."""
+        tool_call = ToolCall(
+            name="topdesk_get_incidents_by_fiql_query",
+            payload={"query": "operator.id==PLACEHOLDER;status!=Closed", "page_size": 5}
+        )
+        
+        resolved = await self.router._resolve_placeholder(tool_call, [])
+        
+        assert resolved.payload == {"query": "operator.id=='NOTFOUND';status!=Closed", "page_size": 5}
+    
+    @pytest.mark.asyncio
+    @patch('app.router.TopdeskMCPClient')
+    async def test_execute_plan_records_errors_per_call(self, mock_client_class):
+        """Test that a failing call in a wave does not drop its siblings."""
+        mock_client = AsyncMock()
+        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client.call_tool.side_effect = [Exception("boom"), {"incidents": []}]
+        
+        plan = QueryPlan(intent="test", steps=[], tool_calls=[
+            ToolCall(name="search", payload={"query": "a"}),
+            ToolCall(name="search", payload={"query": "b"}),
+        ])
+        
+        results = await self.router._execute_plan(plan)
+        
+        assert [result.key for result in results] == ["step_1_search", "step_2_search"]
+        assert results[0].error == "boom"
+        assert results[1].error is None
+        assert results[1].response == {"incidents": []}
+        assert results[1].tool_call.payload["query"] == "b"
+    
+    @pytest.mark.asyncio
+    @patch('app.router.TopdeskMCPClient')
+    async def test_execute_plan_reuses_shared_client(self, mock_client_class):
+        """Test that a shared client is used instead of opening one per query."""
+        shared_client = AsyncMock()
+        shared_client.call_tool.return_value = {"incidents": []}
+        router = QueryRouter(mcp_client=shared_client)
+        
+        plan = QueryPlan(intent="test", steps=[], tool_calls=[
+            ToolCall(name="search", payload={"query": "a"}),
+        ])
+        
+        await router._execute_plan(plan)
+        await router._execute_plan(plan)
+        
+        assert shared_client.call_tool.await_count == 2
+        mock_client_class.assert_not_called()
+    
+    @pytest.mark.asyncio
+    @patch('app.router.sanitize_for_logging')
+    async def test_payload_not_sanitized_without_debug_logging(self, mock_sanitize):
+        """Test that tool payloads are only sanitized for enabled debug logs."""
+        client = AsyncMock()
+        tool_call = ToolCall(name="search", payload={"query": "a"})
+        
+        with patch('app.router.logger.isEnabledFor', return_value=False):
+            await self.router._run_tool_call(client, tool_call, [])
+        
+        mock_sanitize.assert_not_called()
+        client.call_tool.assert_awaited_once_with("search", {"query": "a"})
+    
+    @pytest.mark.asyncio
+    async def test_response_serializes_like_validated_model(self):
+        """Test that the unvalidated success response dumps like a validated one."""
+        client = AsyncMock()
+        client.call_tool.return_value = {"incidents": [{
+            "id": "123",
+            "number": "I-240101-001",
+            "briefDescription": "Email not working",
+            "status": {"name": "Open"},
+            "creationDate": "2024-01-01T10:00:00Z",
+        }]}
+        router = QueryRouter(mcp_client=client)
+        
+        response = await router.process_query(QueryRequest(query="email problem"), "127.0.0.1")
+        
+        validated = QueryResponse.model_validate(dict(response))
+        assert response.model_dump(mode="json") == validated.model_dump(mode="json")
+        assert response.results[0].number == "I-240101-001"
@@ -0,0 +1,147 @@
+"""Tests for rate limiting and circuit breaking."""
+
+import asyncio
+import time
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch
+from app.config import settings
+from app.security import CircuitBreaker, RateLimiter, get_client_ip
+
+
+class TestRateLimiter:
+    """Test token bucket rate limiting."""
+    
+    def setup_method(self):
+        self.limiter = RateLimiter()
+    
+    @pytest.mark.asyncio
+    async def test_consumes_until_empty(self):
+        """Test that requests are rejected once the bucket is drained."""
+        for _ in range(settings.rate_limit_requests):
+            assert await self.limiter.is_allowed("10.0.0.1")
+        
+        assert not await self.limiter.is_allowed("10.0.0.1")
+        assert await self.limiter.is_allowed("10.0.0.2")
+    
+    @pytest.mark.asyncio
+    async def test_remaining(self):
+        """Test remaining budget reporting."""
+        assert await self.limiter.get_remaining("10.0.0.1") == settings.rate_limit_requests
+        
+        allowed, remaining = await self.limiter.is_allowed_with_remaining("10.0.0.1")
+        
+        assert allowed
+        assert remaining == settings.rate_limit_requests - 1
+        assert await self.limiter.get_remaining("10.0.0.1") == settings.rate_limit_requests - 1
+    
+    @pytest.mark.asyncio
+    async def test_remaining_does_not_mutate(self):
+        """Test that reading the remaining budget leaves the bucket untouched."""
+        await self.limiter.is_allowed("10.0.0.1")
+        bucket = self.limiter._buckets["10.0.0.1"]
+        bucket.last_refill -= 1
+        before = (bucket.tokens, bucket.last_refill)
+        
+        remaining = await self.limiter.get_remaining("10.0.0.1")
+        
+        assert remaining == int(min(bucket.capacity, bucket.tokens + bucket.refill_rate))
+        assert (bucket.tokens, bucket.last_refill) == before
+    
+    @pytest.mark.asyncio
+    @patch('app.security._MAX_BUCKETS', 2)
+    async def test_evicts_least_recently_used(self):
+        """Test that the bucket count stays bounded."""
+        await self.limiter.is_allowed("10.0.0.1")
+        await self.limiter.is_allowed("10.0.0.2")
+        await self.limiter.is_allowed("10.0.0.1")
+        await self.limiter.is_allowed("10.0.0.3")
+        
+        assert list(self.limiter._buckets) == ["10.0.0.1", "10.0.0.3"]
+    
+    @pytest.mark.asyncio
+    async def test_drops_refilled_buckets(self):
+        """Test that buckets idle for a whole window are dropped."""
+        await self.limiter.is_allowed("10.0.0.1")
+        await self.limiter.is_allowed("10.0.0.2")
+        self.limiter._buckets["10.0.0.1"].last_refill -= settings.rate_limit_window
+        
+        await self.limiter.is_allowed("10.0.0.3")
+        
+        assert list(self.limiter._buckets) == ["10.0.0.2", "10.0.0.3"]
+
+
+class TestCircuitBreaker:
+    """Test circuit breaker state transitions."""
+    
+    def setup_method(self):
+        self.breaker = CircuitBreaker("test")
+    
+    @pytest.mark.asyncio
+    async def test_closed_state_skips_lock(self):
+        """Test that a closed circuit allows requests without taking the lock."""
+        await self.breaker._lock.acquire()
+        try:
+            assert await asyncio.wait_for(self.breaker.is_request_allowed(), timeout=1)
+        finally:
+            self.breaker._lock.release()
+    
+    @pytest.mark.asyncio
+    async def test_success_resets_failures(self):
+        """Test that a success clears failures recorded while closed."""
+        await self.breaker.record_failure()
+        await self.breaker.record_success()
+        
+        state = await self.breaker.get_state()
+        assert state["failure_count"] == 0
+        assert state["last_success_time"] > 0
+    
+    @pytest.mark.asyncio
+    async def test_opens_after_threshold(self):
+        """Test that repeated failures open the circuit until the timeout."""
+        for _ in range(settings.circuit_breaker_failure_threshold):
+            assert await self.breaker.is_request_allowed()
+            await self.breaker.record_failure()
+        
+        assert not await self.breaker.is_request_allowed()
+        
+        state = await self.breaker.get_state()
+        assert state["state"] == "open"
+        expected = time.time() + settings.circuit_breaker_recovery_timeout
+        assert abs(state["next_attempt_time"] - expected) < 1
+    
+    @pytest.mark.asyncio
+    async def test_half_open_recovers(self):
+        """Test that a success after the timeout closes the circuit."""
+        for _ in range(settings.circuit_breaker_failure_threshold):
+            await self.breaker.record_failure()
+        self.breaker._state.next_attempt_time = time.monotonic() - 1
+        
+        assert await self.breaker.is_request_allowed()
+        await self.breaker.record_success()
+        
+        state = await self.breaker.get_state()
+        assert state["state"] == "closed"
+        assert state["next_attempt_time"] is None
+
+
+class TestGetClientIp:
+    """Test client IP resolution."""
+    
+    @staticmethod
+    def _request(headers, host="127.0.0.1"):
+        """Build a minimal stand-in for a FastAPI request."""
+        return SimpleNamespace(headers=headers, client=SimpleNamespace(host=host) if host else None)
+    
+    def test_forwarded_for_first_hop(self):
+        """Test that the first forwarded hop is the client."""
+        request = self._request({"X-Forwarded-For": " 203.0.113.7 , 10.0.0.1, 10.0.0.2"})
+        assert get_client_ip(request) == "203.0.113.7"
+        assert get_client_ip(self._request({"X-Forwarded-For": "203.0.113.7"})) == "203.0.113.7"
+    
+    def test_fallbacks(self):
+        """Test X-Real-IP and direct connection fallbacks."""
+        assert get_client_ip(self._request({"X-Real-IP": " 198.51.100.1 "})) == "198.51.100.1"
+        assert get_client_ip(self._request({})) == "127.0.0.1"
+        assert get_client_ip(self._request({}, host=None)) == "unknown"
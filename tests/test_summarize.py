@@ -0,0 +1,60 @@
+"""Tests for result summarization utilities."""
+
+from app.schemas import NormalizedIncident
+from app.summarize import _format_counter_summary, generate_error_summary, summarize_incidents
+
+
+def _incident(number, status="Open", priority=None, caller=None, operator=None):
+    """Build a normalized incident with the fields summaries look at."""
+    return NormalizedIncident(
+        id=number, number=number, title="Test incident", status=status,
+        created_at="2024-01-01 10:00:00", priority=priority, caller=caller, operator=operator
+    )
+
+
+class TestSummarizeIncidents:
+    """Test incident list summaries."""
+    
+    def test_empty(self):
+        """Test the summary for no results."""
+        assert summarize_incidents([]) == "No incidents found matching your query."
+    
+    def test_single_status(self):
+        """Test that a uniform status is summarized as 'all'."""
+        assert summarize_incidents([_incident("I-1")]) == "Found 1 incident all Open."
+    
+    def test_breakdown(self):
+        """Test status, priority, assignment and time context together."""
+        incidents = [
+            _incident("I-1", priority="High", caller="John Doe", operator="Jane Smith"),
+            _incident("I-2", status="Closed", priority="Low", caller="John Doe", operator="Jane Smith"),
+            _incident("I-3", priority="Critical", caller="John Doe"),
+        ]
+        
+        summary = summarize_incidents(incidents, "recent incidents for john doe")
+        
+        assert summary == (
+            "Found 3 incidents, 2 Open, 1 Closed, 2 high priority, 2 assigned, "
+            "2 to Jane Smith, (recent)."
+        )
+    
+    def test_format_counts_from_plain_dict(self):
+        """Test that count summaries keep the most common items in insertion order on ties."""
+        counts = {"Open": 2, "Closed": 1, "New": 2, "Pending": 1}
+        assert _format_counter_summary(counts, "status", top_n=3) == "2 Open, 2 New, 1 Closed"
+        assert _format_counter_summary({"Open": 4}, "status") == "all Open"
+
+
+class TestGenerateErrorSummary:
+    """Test user-facing error summaries."""
+    
+    def test_not_found_mentions_lookup_kind(self):
+        """Test that 'not found' errors refer to the kind of lookup queried."""
+        assert "person" in generate_error_summary("Person not found", "tickets for User Jan")
+        assert "operator" in generate_error_summary("Not Found", "Technician Piet")
+        assert generate_error_summary("not found", "printer") == "The requested information was not found."
+    
+    def test_first_matching_error_wins(self):
+        """Test that earlier error categories take precedence."""
+        assert "too long" in generate_error_summary("Timeout: resource not found")
+        assert "contact support" in generate_error_summary("boom")
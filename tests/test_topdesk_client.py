@@ -0,0 +1,201 @@
+"""Tests for the TOPdesk MCP client."""
+
+import asyncio
+import threading
+import httpx
+import pytest
+from unittest.mock import MagicMock, patch
+from app.security import SecurityManager
+from app.tools import topdesk_client
+from app.tools.topdesk_client import MCPClientError, MCPServerError, TopdeskMCPClient, close_client, get_client
+
+
+class TestSharedClient:
+    """Test the module-level shared client."""
+    
+    @pytest.mark.asyncio
+    async def test_get_client_reuses_connection(self):
+        """Test that helpers share one connected client until it is closed."""
+        client = await get_client()
+        try:
+            assert await get_client() is client
+        finally:
+            await close_client()
+        
+        assert topdesk_client._shared_client is None
+        assert client._client is None
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_first_use_opens_one_client(self):
+        """Test that concurrent first callers share a single client."""
+        connects = []
+        
+        async def slow_connect(client):
+            connects.append(client)
+            await asyncio.sleep(0)  # Let the other callers run mid-connect
+        
+        with patch.object(TopdeskMCPClient, "connect", slow_connect):
+            try:
+                clients = await asyncio.gather(*(get_client() for _ in range(5)))
+            finally:
+                await close_client()
+        
+        assert len(connects) == 1
+        assert all(client is clients[0] for client in clients)
+
+
+class TestCallToolMCP:
+    """Test MCP tool calls over HTTP."""
+    
+    def setup_method(self):
+        with patch('app.tools.topdesk_client.settings.mcp_base_url', "http://mcp.test/"):
+            self.client = TopdeskMCPClient()
+        self.requests = []
+    
+    @pytest.fixture(autouse=True)
+    def fresh_security_manager(self):
+        """Isolate the circuit breaker from failures recorded by other tests."""
+        with patch('app.tools.topdesk_client.security_manager', SecurityManager()):
+            yield
+    
+    def _mock_server(self, status_code, body):
+        """Route the client's HTTP calls to a canned response."""
+        def handler(request):
+            self.requests.append(request)
+            return httpx.Response(status_code, content=body)
+        self.client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    
+    @pytest.mark.asyncio
+    async def test_success_decodes_json(self):
+        """Test that a successful response body is decoded."""
+        self._mock_server(200, b'{"incidents": [{"id": "1", "briefDescription": "Caf\\u00e9"}]}')
+        
+        result = await self.client.call_tool("search", {"query": "email"})
+        
+        assert result == {"incidents": [{"id": "1", "briefDescription": "Café"}]}
+        assert str(self.requests[0].url) == "http://mcp.test/tools/search"
+        await self.client.close()
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status_code, headers, body, expected", [
+        (500, {"content-type": "application/json"}, b'{"error": {"message": "db down"}}',
+         "MCP server error 500: db down"),
+        (500, {"content-type": "application/json"}, b'{"detail": "x"}', "MCP server error 500: Unknown error"),
+        (502, {"content-type": "text/html"}, b"<html>Bad gateway</html>", "MCP server error 502"),
+        (400, {"content-type": "application/json"}, b'{"error": "bad"}', "MCP client error 400"),
+    ])
+    async def test_error_messages(self, status_code, headers, body, expected):
+        """Test that error details are taken from small JSON bodies only."""
+        self.client._client = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(status_code, headers=headers, content=body)
+        ))
+        
+        with pytest.raises(MCPClientError) as exc_info:
+            await self.client.call_tool("search", {"query": "email"})
+        
+        assert str(exc_info.value) == expected
+        await self.client.close()
+    
+    @pytest.mark.asyncio
+    async def test_http_error_not_retried(self):
+        """Test that an HTTP error response is raised without retrying or sleeping."""
+        self._mock_server(500, b"")
+        
+        with patch("app.tools.topdesk_client.asyncio.sleep") as sleep:
+            with pytest.raises(MCPServerError):
+                await self.client.call_tool("search", {"query": "email"})
+        
+        assert len(self.requests) == 1
+        sleep.assert_not_called()
+        await self.client.close()
+    
+    @pytest.mark.asyncio
+    async def test_transport_error_retried_with_capped_backoff(self):
+        """Test that transport errors are retried with backoff capped at max_backoff."""
+        def handler(request):
+            self.requests.append(request)
+            raise httpx.ConnectError("connection refused")
+        self.client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        self.client.retries = 3
+        self.client.max_backoff = 1.5
+        
+        with patch("app.tools.topdesk_client.asyncio.sleep") as sleep:
+            with pytest.raises(MCPClientError, match="MCP request failed"):
+                await self.client.call_tool("search", {"query": "email"})
+        
+        assert len(self.requests) == 4
+        waits = [call.args[0] for call in sleep.call_args_list]
+        assert len(waits) == 3
+        assert 1 <= waits[0] <= 1.5
+        assert waits[1:] == [1.5, 1.5]
+        await self.client.close()
+    
+    @pytest.mark.asyncio
+    async def test_call_many_keeps_order_and_errors(self):
+        """Test that concurrent calls return results in call order, with failures as exceptions."""
+        def handler(request):
+            if request.url.path.endswith("topdesk_get_person_by_query"):
+                return httpx.Response(400, content=b"")
+            return httpx.Response(200, content=request.content)
+        self.client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        
+        results = await self.client.call_many([
+            ("search", {"query": "email"}),
+            ("topdesk_get_person_by_query", {"fiql_query": "x"}),
+            ("not_a_tool", {}),
+            ("topdesk_get_operators_by_fiql_query", {"fiql_query": "y"}),
+        ])
+        
+        assert results[0] == {"query": "email"}
+        assert isinstance(results[1], MCPClientError)
+        assert isinstance(results[2], MCPClientError)
+        assert results[3] == {"fiql_query": "y"}
+        await self.client.close()
+
+
+class TestCallToolDirect:
+    """Test tool calls in direct TOPDESK mode."""
+    
+    def setup_method(self):
+        with patch.multiple('app.tools.topdesk_client.settings',
+                            mcp_base_url="direct-topdesk-mode",
+                            topdesk_url="https://topdesk.test",
+                            topdesk_username="user",
+                            topdesk_password="secret"):
+            self.client = TopdeskMCPClient()
+        self.client._topdesk_client = MagicMock()
+    
+    @pytest.mark.asyncio
+    async def test_dispatches_to_sdk(self):
+        """Test that each tool maps onto its TOPDESK SDK call."""
+        sdk = self.client._topdesk_client
+        sdk.utils.is_valid_uuid.return_value = False
+        
+        await self.client.call_tool("search", {"query": "email", "max_results": 3})
+        await self.client.call_tool("topdesk_get_complete_incident_overview", {"incident_id": "I-240101-001"})
+        
+        sdk.incident.get_list.assert_called_once_with(page_size=3, query="email")
+        sdk.incident.get_by_number.assert_called_once_with("I-240101-001")
+        sdk.incident.get_by_id.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_sdk_error_wrapped(self):
+        """Test that SDK failures surface as MCPClientError."""
+        self.client._topdesk_client.person.get_list.side_effect = RuntimeError("boom")
+        
+        with pytest.raises(MCPClientError, match="Direct TOPDESK call failed: boom"):
+            await self.client.call_tool("topdesk_get_person_by_query", {"fiql_query": "x"})
+    
+    @pytest.mark.asyncio
+    async def test_health_check_runs_sdk_in_thread(self):
+        """Test that the direct-mode health probe does not call the SDK on the event loop."""
+        loop_thread = threading.get_ident()
+        sdk_threads = []
+        self.client._topdesk_client.incident.get_list.side_effect = (
+            lambda **kwargs: sdk_threads.append(threading.get_ident())
+        )
+        
+        health = await self.client.health_check()
+        
+        assert health["status"] == "healthy"
+        assert sdk_threads and sdk_threads[0] != loop_thread